@@ -175,39 +175,48 @@ class SessionLogger:
                 timestamp = self.session_start.strftime("%Y%m%d_%H%M%S")
                 filename = f"claude_logs_{timestamp}.txt"
 
-            with open(filename, 'w', encoding='utf-8') as f:
+            # Separator lines are built once; each page entry goes out in a
+            # single writelines call through a large write buffer
+            double_rule = "=" * 80 + "\n"
+            hash_rule = "#" * 80 + "\n"
+            dash_rule = "-" * 80 + "\n"
+            total = len(self.detailed_logs)
+
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
                 # Header
-                f.write("=" * 80 + "\n")
-                f.write("CLAUDE ACTIVITY GENERATOR - DETAILED LOG\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Session Start: {self.session_start.isoformat()}\n")
-                f.write(f"Total Pages Processed: {len(self.detailed_logs)}\n")
-                f.write("=" * 80 + "\n\n")
+                f.writelines((
+                    double_rule,
+                    "CLAUDE ACTIVITY GENERATOR - DETAILED LOG\n",
+                    double_rule,
+                    f"Session Start: {self.session_start.isoformat()}\n",
+                    f"Total Pages Processed: {total}\n",
+                    double_rule, "\n",
+                ))
 
                 # Detailed logs for each page
                 for idx, log_entry in enumerate(self.detailed_logs, 1):
-                    f.write(f"\n{'#' * 80}\n")
-                    f.write(f"PAGE {log_entry['page_number']} - Entry {idx}/{len(self.detailed_logs)}\n")
-                    f.write(f"Timestamp: {log_entry['timestamp']}\n")
-                    f.write(f"{'#' * 80}\n\n")
-
-                    f.write("PROMPT SENT TO CLAUDE:\n")
-                    f.write("-" * 80 + "\n")
-                    f.write(log_entry['prompt'])
-                    f.write("\n" + "-" * 80 + "\n\n")
-
-                    f.write("CLAUDE RESPONSE:\n")
-                    f.write("-" * 80 + "\n")
-                    f.write(log_entry['response'])
-                    f.write("\n" + "-" * 80 + "\n\n")
+                    f.writelines((
+                        "\n", hash_rule,
+                        f"PAGE {log_entry['page_number']} - Entry {idx}/{total}\n",
+                        f"Timestamp: {log_entry['timestamp']}\n",
+                        hash_rule, "\n",
+                        "PROMPT SENT TO CLAUDE:\n", dash_rule,
+                        log_entry['prompt'],
+                        "\n", dash_rule, "\n",
+                        "CLAUDE RESPONSE:\n", dash_rule,
+                        log_entry['response'],
+                        "\n", dash_rule, "\n",
+                    ))
 
                 # Summary section
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("SUMMARY\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Total API calls: {len(self.detailed_logs)}\n")
                 duration = (datetime.now() - self.session_start).total_seconds()
-                f.write(f"Session duration: {duration:.2f} seconds\n")
+                f.writelines((
+                    "\n", double_rule,
+                    "SUMMARY\n",
+                    double_rule,
+                    f"Total API calls: {total}\n",
+                    f"Session duration: {duration:.2f} seconds\n",
+                ))
 
                 # Variety summary if provided
                 if variety_summary:
@@ -216,7 +225,7 @@ class SessionLogger:
                         items_str = ', '.join(items) if items else 'none'
                         f.write(f"  {activity_type}: {items_str}\n")
 
-                f.write("=" * 80 + "\n")
+                f.write(double_rule)
 
             return filename
 
@@ -91,8 +91,9 @@ class PromptStrategy(ABC):
         """
         import random
 
-        # Filter out used items
-        available = [opt for opt in available_options if opt not in used_items]
+        # Filter out used items (set lookup keeps the filter linear)
+        used = set(used_items)
+        available = [opt for opt in available_options if opt not in used]
 
         # Reset if all used
         if not available:
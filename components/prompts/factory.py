@@ -41,6 +41,9 @@ class PromptBuilderFactory:
         'dot-to-dot': DotToDotPromptStrategy,
     }
 
+    # Strategies hold no per-call state, so one instance per type is reused
+    _instances: Dict[str, PromptStrategy] = {}
+
     @classmethod
     def get_builder(cls, page_type: str) -> PromptStrategy:
         """Get appropriate prompt strategy for page type.
@@ -49,7 +52,7 @@ class PromptBuilderFactory:
             page_type: Type of activity page (coloring, tracing, etc.)
 
         Returns:
-            Instance of appropriate PromptStrategy
+            Shared instance of appropriate PromptStrategy
 
         Raises:
             ValueError: If page_type is unknown
@@ -64,6 +67,10 @@ class PromptBuilderFactory:
                 ...
             ValueError: Unknown page type: invalid
         """
+        builder = cls._instances.get(page_type)
+        if builder is not None:
+            return builder
+
         strategy_class = cls._strategies.get(page_type)
 
         if not strategy_class:
@@ -73,7 +80,8 @@ class PromptBuilderFactory:
                 f"Available types: {available}"
             )
 
-        return strategy_class()
+        builder = cls._instances[page_type] = strategy_class()
+        return builder
 
     @classmethod
     def register_strategy(cls, page_type: str, strategy_class: Type[PromptStrategy]):
@@ -93,6 +101,7 @@ class PromptBuilderFactory:
             >>> assert isinstance(builder, CustomStrategy)
         """
         cls._strategies[page_type] = strategy_class
+        cls._instances.pop(page_type, None)
 
     @classmethod
     def get_available_types(cls) -> list[str]:
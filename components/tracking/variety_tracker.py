@@ -40,8 +40,10 @@ class VarietyTracker:
             activity_types = ['coloring', 'tracing', 'counting', 'dot-to-dot',
                             'maze', 'matching']
 
-        self._used_items: Dict[str, List[str]] = {
-            activity_type: [] for activity_type in activity_types
+        # Used items per type, kept as insertion-ordered dicts (values unused)
+        # so membership checks are O(1) while get_used keeps selection order
+        self._used_items: Dict[str, Dict[str, None]] = {
+            activity_type: {} for activity_type in activity_types
         }
 
     def select_unused(
@@ -86,22 +88,19 @@ class VarietyTracker:
             raise ValueError(f"Available list is empty for {activity_type}")
 
         # Ensure activity type is tracked
-        if activity_type not in self._used_items:
-            self._used_items[activity_type] = []
-
-        used = self._used_items[activity_type]
+        used = self._used_items.setdefault(activity_type, {})
         unused = [item for item in available if item not in used]
 
         # Reset if all items have been used
         if not unused:
-            self._used_items[activity_type] = []
+            used.clear()
             unused = available
 
         # Select random item
         selected = random.choice(unused)
 
         # Mark as used
-        self._used_items[activity_type].append(selected)
+        used[selected] = None
 
         return selected
 
@@ -118,11 +117,7 @@ class VarietyTracker:
             >>> 'cat' in tracker.get_used('coloring')
             True
         """
-        if activity_type not in self._used_items:
-            self._used_items[activity_type] = []
-
-        if item not in self._used_items[activity_type]:
-            self._used_items[activity_type].append(item)
+        self._used_items.setdefault(activity_type, {}).setdefault(item, None)
 
     def get_used(self, activity_type: str) -> List[str]:
         """Get list of used items for activity type.
@@ -139,7 +134,7 @@ class VarietyTracker:
             >>> tracker.get_used('counting')
             ['5-apple']
         """
-        return self._used_items.get(activity_type, []).copy()
+        return list(self._used_items.get(activity_type, ()))
 
     def reset(self, activity_type: Optional[str] = None):
         """Reset tracking for activity type or all types.
@@ -163,11 +158,11 @@ class VarietyTracker:
         """
         if activity_type:
             if activity_type in self._used_items:
-                self._used_items[activity_type] = []
+                self._used_items[activity_type].clear()
         else:
             # Reset all
-            for key in self._used_items:
-                self._used_items[key] = []
+            for used in self._used_items.values():
+                used.clear()
 
     def get_summary(self) -> Dict[str, List[str]]:
         """Get summary of all used items across all activity types.
@@ -183,7 +178,7 @@ class VarietyTracker:
             >>> summary['coloring']
             ['cat', 'dog']
         """
-        return {k: v.copy() for k, v in self._used_items.items()}
+        return {k: list(v) for k, v in self._used_items.items()}
 
     def has_available(self, activity_type: str, available: List[str]) -> bool:
         """Check if there are unused items available.
@@ -204,7 +199,7 @@ class VarietyTracker:
             >>> tracker.has_available('coloring', ['cat', 'dog'])
             False
         """
-        used = self._used_items.get(activity_type, [])
+        used = self._used_items.get(activity_type, {})
         return any(item not in used for item in available)
 
     def get_count(self, activity_type: str) -> int:
@@ -224,7 +219,7 @@ class VarietyTracker:
             >>> tracker.get_count('coloring')
             1
         """
-        return len(self._used_items.get(activity_type, []))
+        return len(self._used_items.get(activity_type, ()))
 
 
 if __name__ == "__main__":
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
+
+from reportlab.lib.utils import ImageReader
 
 
 logger = logging.getLogger(__name__)
@@ -47,3 +50,41 @@ def load_assets(directory: Path | None = None) -> Dict[str, Path]:
         assets[slug] = path
     return assets
 
+
+@functools.cache
+def get_assets() -> Dict[str, Path]:
+    """Return the slug-to-path map for ``ASSETS_DIR``, scanned once per process.
+
+    The map is shared; treat it as read-only.
+    """
+
+    return load_assets()
+
+
+@functools.lru_cache(maxsize=256)
+def _load_svg_drawing(path_str: str, mtime_ns: int) -> Any:
+    # svglib pulls in reportlab.graphics and an XML stack; only pay for it
+    # when an SVG asset is actually rendered
+    from svglib.svglib import svg2rlg
+
+    return svg2rlg(path_str)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_image(path_str: str, mtime_ns: int) -> ImageReader:
+    return ImageReader(path_str)
+
+
+def load_svg_drawing(path: Path) -> Any:
+    """Parse an SVG asset once per (path, mtime).
+
+    The drawing is shared between callers; copy it before mutating.
+    """
+
+    return _load_svg_drawing(str(path), path.stat().st_mtime_ns)
+
+
+def load_image(path: Path) -> ImageReader:
+    """Decode a raster asset once per (path, mtime)."""
+
+    return _load_image(str(path), path.stat().st_mtime_ns)
@@ -9,7 +9,7 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
 
-from scripts.assets import load_assets, normalize_slug
+from scripts.assets import get_assets, normalize_slug
 from scripts.helpers import Primitives, RenderContext
 from scripts.pages import coloring, counting, dot_to_dot, matching, maze, tracing
 
@@ -38,7 +38,7 @@ class ActivityBookletGenerator:
         self.c = canvas.Canvas(str(output_path), pagesize=A4)
         self.width, self.height = A4
         self.margin = max(0.75 * inch, kid_margin(self.width, self.height))
-        self.asset_map = load_assets()
+        self.asset_map = get_assets()
         self._renderers: Dict[str, PageRenderer] = {
             "coloring": coloring.render,
             "tracing": tracing.render,
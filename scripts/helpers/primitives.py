@@ -7,12 +7,29 @@ Provides both small item-sized primitives and full-page shapes.
 from __future__ import annotations
 
 import math
+from typing import Sequence
 
 from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 
 from scripts.helpers import constants
 
 
+_TAU = 2.0 * math.pi
+# Base of an equilateral triangle per unit of height
+_TWO_OVER_SQRT3 = 2.0 / math.sqrt(3.0)
+
+# Unit-circle (cos, sin) pairs for the star's outer/inner vertices; the
+# angles are fixed by constants, so only the radii vary per call.
+_STAR_UNIT = tuple(
+    (
+        math.cos(math.radians(i * constants.STAR_ANGLE_DEGREES + constants.STAR_START_ANGLE)),
+        math.sin(math.radians(i * constants.STAR_ANGLE_DEGREES + constants.STAR_START_ANGLE)),
+    )
+    for i in range(constants.STAR_POINTS)
+)
+
+
 class Primitives:
     """
     Reusable primitive shapes with consistent APIs.
@@ -26,57 +43,49 @@ class Primitives:
     # ==================================================================
 
     @staticmethod
-    def draw_star(
-        c: Canvas,
+    def add_star(
+        path: PDFPathObject,
         x: float,
         y: float,
         outer_radius: float = constants.STAR_OUTER_RADIUS,
         inner_radius: float = constants.STAR_INNER_RADIUS,
     ) -> None:
         """
-        Draw a 5-pointed star centered at (x, y).
+        Append a closed 5-pointed star centered at (x, y) to a path.
 
         Args:
-            c: ReportLab canvas
+            path: ReportLab path object to extend
             x: Center X coordinate
             y: Center Y coordinate
             outer_radius: Outer point radius (default: 20)
             inner_radius: Inner point radius (default: 10)
         """
-        points = []
         # 10 points total (5 outer, 5 inner)
-        for i in range(constants.STAR_POINTS):
-            angle = math.radians(i * constants.STAR_ANGLE_DEGREES + constants.STAR_START_ANGLE)
+        cos_a, sin_a = _STAR_UNIT[0]
+        path.moveTo(x + outer_radius * cos_a, y + outer_radius * sin_a)
+        for i in range(1, len(_STAR_UNIT)):
+            cos_a, sin_a = _STAR_UNIT[i]
             radius = outer_radius if i % 2 == 0 else inner_radius
-            px = x + radius * math.cos(angle)
-            py = y + radius * math.sin(angle)
-            points.append((px, py))
-
-        path = c.beginPath()
-        path.moveTo(points[0][0], points[0][1])
-        for px, py in points[1:]:
-            path.lineTo(px, py)
+            path.lineTo(x + radius * cos_a, y + radius * sin_a)
         path.close()
-        c.drawPath(path, stroke=1, fill=0)
 
     @staticmethod
-    def draw_heart(
-        c: Canvas,
+    def add_heart(
+        path: PDFPathObject,
         x: float,
         y: float,
         size: float = constants.HEART_SIZE,
     ) -> None:
         """
-        Draw a heart centered at (x, y).
+        Append a heart centered at (x, y) to a path.
 
         Args:
-            c: ReportLab canvas
+            path: ReportLab path object to extend
             x: Center X coordinate
             y: Center Y coordinate
             size: Heart size scale factor (default: 15)
         """
         # Use proportional offsets based on size
-        path = c.beginPath()
         path.moveTo(x, y - size)
         path.curveTo(
             x - size * 1.33,  # -20 when size=15
@@ -94,6 +103,84 @@ class Primitives:
             x,
             y - size,
         )
+
+    @staticmethod
+    def add_circle(
+        path: PDFPathObject,
+        x: float,
+        y: float,
+        radius: float = constants.STAR_OUTER_RADIUS,
+    ) -> None:
+        """
+        Append a circle centered at (x, y) to a path.
+
+        Args:
+            path: ReportLab path object to extend
+            x: Center X coordinate
+            y: Center Y coordinate
+            radius: Circle radius (default: 20)
+        """
+        path.circle(x, y, radius)
+
+    @staticmethod
+    def add_square(
+        path: PDFPathObject,
+        x: float,
+        y: float,
+        size: float = 30,
+    ) -> None:
+        """
+        Append a square centered at (x, y) to a path.
+
+        Args:
+            path: ReportLab path object to extend
+            x: Center X coordinate
+            y: Center Y coordinate
+            size: Square side length (default: 30)
+        """
+        half_size = size / 2
+        path.rect(x - half_size, y - half_size, size, size)
+
+    @staticmethod
+    def draw_star(
+        c: Canvas,
+        x: float,
+        y: float,
+        outer_radius: float = constants.STAR_OUTER_RADIUS,
+        inner_radius: float = constants.STAR_INNER_RADIUS,
+    ) -> None:
+        """
+        Draw a 5-pointed star centered at (x, y).
+
+        Args:
+            c: ReportLab canvas
+            x: Center X coordinate
+            y: Center Y coordinate
+            outer_radius: Outer point radius (default: 20)
+            inner_radius: Inner point radius (default: 10)
+        """
+        path = c.beginPath()
+        Primitives.add_star(path, x, y, outer_radius, inner_radius)
+        c.drawPath(path, stroke=1, fill=0)
+
+    @staticmethod
+    def draw_heart(
+        c: Canvas,
+        x: float,
+        y: float,
+        size: float = constants.HEART_SIZE,
+    ) -> None:
+        """
+        Draw a heart centered at (x, y).
+
+        Args:
+            c: ReportLab canvas
+            x: Center X coordinate
+            y: Center Y coordinate
+            size: Heart size scale factor (default: 15)
+        """
+        path = c.beginPath()
+        Primitives.add_heart(path, x, y, size)
         c.drawPath(path, stroke=1, fill=0)
 
     @staticmethod
@@ -112,7 +199,9 @@ class Primitives:
             y: Center Y coordinate
             radius: Circle radius (default: 20)
         """
-        c.circle(x, y, radius, stroke=1, fill=0)
+        path = c.beginPath()
+        Primitives.add_circle(path, x, y, radius)
+        c.drawPath(path, stroke=1, fill=0)
 
     @staticmethod
     def draw_square(
@@ -130,8 +219,9 @@ class Primitives:
             y: Center Y coordinate
             size: Square side length (default: 30)
         """
-        half_size = size / 2
-        c.rect(x - half_size, y - half_size, size, size, stroke=1, fill=0)
+        path = c.beginPath()
+        Primitives.add_square(path, x, y, size)
+        c.drawPath(path, stroke=1, fill=0)
 
     # ==================================================================
     # DOT LAYOUTS (for dot-to-dot activities)
@@ -158,13 +248,18 @@ class Primitives:
         Returns:
             List of (x, y) dot positions
         """
-        dots = []
+        if num_dots <= 0:
+            return []
+        step = _TAU / num_dots
+        cos_step, sin_step = math.cos(step), math.sin(step)
+        # Rotate (cos, sin) by one step per dot instead of calling the trig
+        # functions for every angle
+        cos_a, sin_a = 1.0, 0.0
+        dots = [None] * num_dots
         for i in range(num_dots):
-            angle = (i / num_dots) * 2 * math.pi
             radius = outer_radius if i % 2 == 0 else inner_radius
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            dots.append((x, y))
+            dots[i] = (center_x + radius * cos_a, center_y + radius * sin_a)
+            cos_a, sin_a = cos_a * cos_step - sin_a * sin_step, sin_a * cos_step + cos_a * sin_step
         return dots
 
     @staticmethod
@@ -186,12 +281,17 @@ class Primitives:
         Returns:
             List of (x, y) dot positions
         """
-        dots = []
+        if num_dots <= 0:
+            return []
+        step = _TAU / num_dots
+        cos_step, sin_step = math.cos(step), math.sin(step)
+        # Rotate (cos, sin) by one step per dot instead of calling the trig
+        # functions for every angle
+        cos_a, sin_a = 1.0, 0.0
+        dots = [None] * num_dots
         for i in range(num_dots):
-            angle = (i / num_dots) * 2 * math.pi
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            dots.append((x, y))
+            dots[i] = (center_x + radius * cos_a, center_y + radius * sin_a)
+            cos_a, sin_a = cos_a * cos_step - sin_a * sin_step, sin_a * cos_step + cos_a * sin_step
         return dots
 
     @staticmethod
@@ -207,22 +307,33 @@ class Primitives:
         if not points:
             return []
 
+        # Drop repeated vertices (including a closing copy of the first one)
+        # so every segment below has a non-zero length
+        pts = [points[0]]
+        for point in points[1:]:
+            if point != pts[-1]:
+                pts.append(point)
+        if len(pts) > 1 and pts[-1] == pts[0]:
+            pts.pop()
+
         # Ensure we have at least two points to form segments
-        if len(points) == 1:
-            return [points[0]] * num_samples
+        if len(pts) < 2:
+            return [pts[0]] * num_samples
+        points = pts
 
         # Pre-compute cumulative segment lengths for proportional sampling
+        # together with each segment's start point and (dx, dy) delta
         segment_lengths: list[float] = []
+        segments: list[tuple[float, float, float, float]] = []
         total_length = 0.0
-        for index, start in enumerate(points):
-            end = points[(index + 1) % len(points)]
-            length = math.hypot(end[0] - start[0], end[1] - start[1])
+        for index, (sx, sy) in enumerate(points):
+            ex, ey = points[(index + 1) % len(points)]
+            dx, dy = ex - sx, ey - sy
+            length = math.hypot(dx, dy)
             segment_lengths.append(length)
+            segments.append((sx, sy, dx, dy))
             total_length += length
 
-        if total_length == 0:
-            return [points[0]] * num_samples
-
         cumulative: list[float] = [0.0]
         running_total = 0.0
         for length in segment_lengths:
@@ -243,19 +354,11 @@ class Primitives:
             ):
                 segment_index += 1
 
-            segment_length = segment_lengths[segment_index]
-            if segment_length == 0:
-                sampled.append(points[segment_index])
-                continue
-
-            start = points[segment_index]
-            end = points[(segment_index + 1) % len(points)]
-            segment_start_distance = cumulative[segment_index]
-            position_ratio = (target - segment_start_distance) / segment_length
-
-            x = start[0] + (end[0] - start[0]) * position_ratio
-            y = start[1] + (end[1] - start[1]) * position_ratio
-            sampled.append((x, y))
+            sx, sy, dx, dy = segments[segment_index]
+            position_ratio = (
+                target - cumulative[segment_index]
+            ) / segment_lengths[segment_index]
+            sampled.append((sx + dx * position_ratio, sy + dy * position_ratio))
 
         return sampled
 
@@ -280,18 +383,26 @@ class Primitives:
         Returns:
             List of (x, y) dot positions
         """
-        dots = []
+        if num_dots <= 0:
+            return []
+        step = _TAU / num_dots
+        cos_step, sin_step = math.cos(step), math.sin(step)
+        # Rotate (cos t, sin t) by one step per dot, as the circle and star
+        # generators do, instead of calling the trig functions for every t
+        cos_t, sin_t = 1.0, 0.0
+        dots = [None] * num_dots
         for i in range(num_dots):
-            t = (i / num_dots) * 2 * math.pi
+            # Expand cos(2t), cos(3t), cos(4t) from cos(t) so each dot needs
+            # no trig calls at all
+            cos_sq = cos_t * cos_t
+            cos_2t = 2 * cos_sq - 1
+            cos_3t = (4 * cos_sq - 3) * cos_t
+            cos_4t = 2 * cos_2t * cos_2t - 1
             # Parametric heart equations
-            x = center_x + scale * (16 * math.sin(t) ** 3) / 16
-            y = center_y + scale * (
-                13 * math.cos(t)
-                - 5 * math.cos(2 * t)
-                - 2 * math.cos(3 * t)
-                - math.cos(4 * t)
-            ) / 13
-            dots.append((x, y))
+            x = center_x + scale * sin_t * sin_t * sin_t
+            y = center_y + scale * (13 * cos_t - 5 * cos_2t - 2 * cos_3t - cos_4t) / 13
+            dots[i] = (x, y)
+            cos_t, sin_t = cos_t * cos_step - sin_t * sin_step, sin_t * cos_step + cos_t * sin_step
         return dots
 
     @staticmethod
@@ -315,27 +426,26 @@ class Primitives:
         Returns:
             List of (x, y) dot positions
         """
-        dots = []
+        half = side_length / 2
+        # (start corner, unit direction) per side: top, right, bottom, left
+        edges = [
+            ((center_x - half, center_y + half), (1.0, 0.0)),
+            ((center_x + half, center_y + half), (0.0, -1.0)),
+            ((center_x + half, center_y - half), (-1.0, 0.0)),
+            ((center_x - half, center_y - half), (0.0, 1.0)),
+        ]
         perimeter = 4 * side_length
+        inv_side = 1 / side_length
 
+        dots = []
         for i in range(num_dots):
             # Calculate position along perimeter (0 to perimeter)
             pos = (i / num_dots) * perimeter
-
-            if pos < side_length:  # Top side
-                x = center_x - side_length / 2 + pos
-                y = center_y + side_length / 2
-            elif pos < 2 * side_length:  # Right side
-                x = center_x + side_length / 2
-                y = center_y + side_length / 2 - (pos - side_length)
-            elif pos < 3 * side_length:  # Bottom side
-                x = center_x + side_length / 2 - (pos - 2 * side_length)
-                y = center_y - side_length / 2
-            else:  # Left side
-                x = center_x - side_length / 2
-                y = center_y - side_length / 2 + (pos - 3 * side_length)
-
-            dots.append((x, y))
+            # Index the side directly instead of branching on the position
+            side = min(int(pos * inv_side), 3)
+            dist = pos - side * side_length
+            (sx, sy), (dx, dy) = edges[side]
+            dots.append((sx + dx * dist, sy + dy * dist))
         return dots
 
     @staticmethod
@@ -360,7 +470,7 @@ class Primitives:
             List of (x, y) dot positions
         """
         dots = []
-        base = height * 2 / math.sqrt(3)  # Equilateral triangle ratio
+        base = height * _TWO_OVER_SQRT3  # Equilateral triangle ratio
 
         # Define the three vertices (top, bottom-right, bottom-left)
         vertices = [
@@ -369,28 +479,24 @@ class Primitives:
             (center_x - base / 2, center_y - height / 2),  # Bottom-left
         ]
 
-        # Calculate perimeter
         side_length = base
         perimeter = 3 * side_length
+        inv_side = 1 / side_length
+
+        # (start vertex, unit direction) per side, following the vertex order
+        edges = []
+        for index, (sx, sy) in enumerate(vertices):
+            ex, ey = vertices[(index + 1) % 3]
+            edges.append(((sx, sy), ((ex - sx) * inv_side, (ey - sy) * inv_side)))
 
         for i in range(num_dots):
             # Calculate position along perimeter
             pos = (i / num_dots) * perimeter
-
-            if pos < side_length:  # Side 1: top to bottom-right
-                t = pos / side_length
-                x = vertices[0][0] + t * (vertices[1][0] - vertices[0][0])
-                y = vertices[0][1] + t * (vertices[1][1] - vertices[0][1])
-            elif pos < 2 * side_length:  # Side 2: bottom-right to bottom-left
-                t = (pos - side_length) / side_length
-                x = vertices[1][0] + t * (vertices[2][0] - vertices[1][0])
-                y = vertices[1][1] + t * (vertices[2][1] - vertices[1][1])
-            else:  # Side 3: bottom-left to top
-                t = (pos - 2 * side_length) / side_length
-                x = vertices[2][0] + t * (vertices[0][0] - vertices[2][0])
-                y = vertices[2][1] + t * (vertices[0][1] - vertices[2][1])
-
-            dots.append((x, y))
+            # Index the side directly instead of branching on the position
+            side = min(int(pos * inv_side), 2)
+            dist = pos - side * side_length
+            (sx, sy), (dx, dy) = edges[side]
+            dots.append((sx + dx * dist, sy + dy * dist))
         return dots
 
     @staticmethod
@@ -451,11 +557,13 @@ class Primitives:
         canopy_center_y = center_y + trunk_height * 0.25
         canopy_points: list[tuple[float, float]] = []
         lobes = 6
+        sin, cos = math.sin, math.cos
+        step = _TAU / (lobes * 2)
         for i in range(lobes * 2):
-            angle = (i / (lobes * 2)) * 2 * math.pi
-            radius = canopy_radius * (0.8 + 0.2 * math.sin(lobes * angle))
-            x = center_x + radius * math.cos(angle)
-            y = canopy_center_y + radius * 0.8 * math.sin(angle)
+            angle = i * step
+            radius = canopy_radius * (0.8 + 0.2 * sin(lobes * angle))
+            x = center_x + radius * cos(angle)
+            y = canopy_center_y + radius * 0.8 * sin(angle)
             canopy_points.append((x, y))
 
         trunk_top_y = center_y - trunk_height / 2
@@ -483,11 +591,13 @@ class Primitives:
 
         target = max(num_dots, petals * 2)
         dots = []
+        sin, cos = math.sin, math.cos
+        step = _TAU / target
         for i in range(target):
-            angle = (i / target) * 2 * math.pi
-            radius = base_radius + petal_amplitude * math.sin(petals * angle)
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
+            angle = i * step
+            radius = base_radius + petal_amplitude * sin(petals * angle)
+            x = center_x + radius * cos(angle)
+            y = center_y + radius * sin(angle)
             dots.append((x, y))
         return dots
 
@@ -503,17 +613,19 @@ class Primitives:
 
         target = max(num_dots, 16)
         dots = []
+        sin, cos = math.sin, math.cos
+        step = _TAU / target
         for i in range(target):
-            angle = (i / target) * 2 * math.pi
+            angle = i * step
             # Create mirrored lobes for left/right wings using cosine weighting
-            horizontal = math.cos(angle)
-            vertical = math.sin(angle)
+            horizontal = cos(angle)
+            vertical = sin(angle)
             lobe_factor = 0.6 + 0.4 * abs(vertical)
             wing_x = wing_span * 0.5 * horizontal * lobe_factor
             wing_y = wing_height * 0.5 * vertical * (0.7 + 0.3 * abs(horizontal))
 
             # Pinch shape toward the body at the center
-            body_pull = 40 * math.cos(2 * angle)
+            body_pull = 40 * cos(2 * angle)
             x = center_x + wing_x + body_pull
             y = center_y + wing_y
             dots.append((x, y))
@@ -582,7 +694,7 @@ class Primitives:
     @staticmethod
     def draw_dots(
         c: Canvas,
-        positions: list[tuple[float, float]],
+        positions: Sequence[tuple[float, float]],
         radius: float = constants.DOT_RADIUS,
         numbered: bool = True,
     ) -> None:
@@ -595,11 +707,19 @@ class Primitives:
             radius: Dot radius (default: 4)
             numbered: Whether to draw numbers on dots (default: True)
         """
-        for idx, (x, y) in enumerate(positions, start=1):
-            # Draw the dot
-            c.circle(x, y, radius, stroke=1, fill=1)
-
-            # Draw the number if requested
-            if numbered:
-                c.setFont(constants.FONT_FAMILY_BODY, 10)
-                c.drawCentredString(x, y - radius - 8, str(idx))
+        if not positions:
+            return
+
+        # Draw every dot as part of a single path
+        path = c.beginPath()
+        for x, y in positions:
+            path.circle(x, y, radius)
+        c.drawPath(path, stroke=1, fill=1)
+
+        # Draw the numbers if requested
+        if numbered:
+            c.setFont(constants.FONT_FAMILY_BODY, 10)
+            draw_centred = c.drawCentredString
+            label_offset = radius + 8
+            for idx, (x, y) in enumerate(positions, start=1):
+                draw_centred(x, y - label_offset, str(idx))
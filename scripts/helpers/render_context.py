@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 
 from reportlab.pdfgen import canvas
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RenderContext:
     """
     Typed context for page rendering, replacing the untyped helpers dict.
@@ -39,22 +39,15 @@ class RenderContext:
     # Asset lookup
     asset_lookup: Callable[[Optional[str]], Optional[Path]]
 
-    @property
-    def center_x(self) -> float:
-        """Center X coordinate of canvas."""
-        return self.width / 2
-
-    @property
-    def center_y(self) -> float:
-        """Center Y coordinate of canvas."""
-        return self.height / 2
-
-    @property
-    def content_width(self) -> float:
-        """Available width inside margins."""
-        return self.width - (2 * self.margin)
-
-    @property
-    def content_height(self) -> float:
-        """Available height inside margins."""
-        return self.height - (2 * self.margin)
+    # Derived geometry, computed once at construction
+    center_x: float = field(init=False, repr=False)  # Center X coordinate of canvas
+    center_y: float = field(init=False, repr=False)  # Center Y coordinate of canvas
+    content_width: float = field(init=False, repr=False)  # Available width inside margins
+    content_height: float = field(init=False, repr=False)  # Available height inside margins
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields must bypass __setattr__
+        object.__setattr__(self, "center_x", self.width / 2)
+        object.__setattr__(self, "center_y", self.height / 2)
+        object.__setattr__(self, "content_width", self.width - (2 * self.margin))
+        object.__setattr__(self, "content_height", self.height - (2 * self.margin))
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
 from reportlab.lib import colors
-from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen.canvas import Canvas
-from reportlab.graphics import renderPDF
-from svglib.svglib import svg2rlg
 
+from scripts.assets import load_image, load_svg_drawing
 from scripts.drawing.shapes import get_renderer
 from scripts.helpers import RenderContext, constants
 
@@ -31,9 +30,13 @@ def _draw_asset(c: Canvas, path: Path, box: Tuple[float, float, float, float]) -
     suffix = path.suffix.lower()
     try:
         if suffix == ".svg":
-            drawing = svg2rlg(str(path))
+            from reportlab.graphics import renderPDF
+
+            drawing = load_svg_drawing(path)
             if drawing is None or drawing.width == 0 or drawing.height == 0:
                 return False
+            # The cached drawing is shared; scale a shallow copy instead
+            drawing = copy.copy(drawing)
             scale = min(box_width / drawing.width, box_height / drawing.height)
             min_x = getattr(drawing, "minX", 0.0)
             min_y = getattr(drawing, "minY", 0.0)
@@ -47,7 +50,7 @@ def _draw_asset(c: Canvas, path: Path, box: Tuple[float, float, float, float]) -
                 translate_y - min_y * scale,
             )
         elif suffix in _RASTER_EXTENSIONS:
-            image = ImageReader(str(path))
+            image = load_image(path)
             img_width, img_height = image.getSize()
             if img_width == 0 or img_height == 0:
                 return False
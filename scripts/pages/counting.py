@@ -43,18 +43,23 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     )
     positions = LayoutHelpers.calculate_grid_positions(ctx.width, ctx.height, grid_config)
 
-    # Draw items at calculated positions using Primitives
+    # Pick the primitive once, then add every item into a single path so
+    # the whole grid is stroked once
     lower_item = str(item).lower()
+    if "circle" in lower_item:
+        add_item = Primitives.add_circle
+    elif "star" in lower_item:
+        add_item = Primitives.add_star
+    elif "heart" in lower_item:
+        add_item = Primitives.add_heart
+    else:
+        add_item = Primitives.add_square
+
     if positions:
+        path = c.beginPath()
         for pos in positions:
-            if "circle" in lower_item:
-                Primitives.draw_circle(c, pos.x, pos.y, constants.STAR_OUTER_RADIUS)
-            elif "star" in lower_item:
-                Primitives.draw_star(c, pos.x, pos.y)
-            elif "heart" in lower_item:
-                Primitives.draw_heart(c, pos.x, pos.y)
-            else:
-                Primitives.draw_square(c, pos.x, pos.y, 30)
+            add_item(path, pos.x, pos.y)
+        c.drawPath(path, stroke=1, fill=0)
 
     # Draw answer box
     c.setFont(constants.FONT_FAMILY_BODY, constants.FONT_SIZE_NUMBER)
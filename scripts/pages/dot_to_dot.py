@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Iterable, Tuple
+from itertools import islice
+from typing import Any, Dict, Sequence, Tuple
 
 from reportlab.lib import colors
 from reportlab.pdfgen.canvas import Canvas
@@ -17,36 +18,6 @@ logger = logging.getLogger(__name__)
 Dot = Tuple[float, float]
 
 
-def _draw_shape_outline_dashed(c: Canvas, shape: str, dots: Iterable[Dot]) -> None:
-    """Draw a dashed outline connecting the dot positions as a guide."""
-    dot_list = list(dots)
-    if len(dot_list) < 3:
-        logger.warning(f"Not enough dots to draw outline: {len(dot_list)} < 3")
-        return
-
-    logger.debug(f"Drawing dashed outline for shape '{shape}' with {len(dot_list)} dots")
-
-    # Save current state
-    c.saveState()
-
-    # Set dashed line style - lighter and more visible
-    c.setDash(8, 8)  # 8px dash, 8px gap
-    c.setStrokeGray(0.5)  # Medium gray
-    c.setLineWidth(1.5)
-
-    # Draw path connecting all dots
-    path = c.beginPath()
-    path.moveTo(dot_list[0][0], dot_list[0][1])
-    for x, y in dot_list[1:]:
-        path.lineTo(x, y)
-    path.close()
-
-    c.drawPath(path, stroke=1, fill=0)
-
-    # Restore state
-    c.restoreState()
-
-
 def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     """
     Render a dot-to-dot activity page.
@@ -55,7 +26,7 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     """
     title = page_spec.get("title", "Connect the Dots")
     shape = page_spec.get("shape", "star")
-    logger.info(f"Rendering dot-to-dot page: {title}, shape: {shape}")
+    logger.debug("Rendering dot-to-dot page: %s, shape: %s", title, shape)
 
     # Draw page frame
     ctx.draw_border()
@@ -67,15 +38,34 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
 
     # Generate dot positions if not provided
     if "dot_positions" not in page_spec:
-        logger.debug(f"Generating dot positions for shape '{shape}' with {dots_count} dots")
+        logger.debug("Generating dot positions for shape '%s' with %s dots", shape, dots_count)
         page_spec["dot_positions"] = ctx.generate_dot_positions(shape, dots_count)
 
-    dots: Iterable[Dot] = page_spec["dot_positions"]
-    dot_list = list(dots)
-    logger.info(f"Drawing {len(dot_list)} dots")
+    # Any sequence of (x, y) pairs works (generators return lists, cached
+    # callers may pass tuples), so use it directly instead of copying
+    dot_list: Sequence[Dot] = page_spec["dot_positions"]
+    logger.debug("Drawing %d dots", len(dot_list))
 
-    # Draw dashed outline guide first
-    _draw_shape_outline_dashed(c, shape, dot_list)
+    # Draw dashed outline guide first. No saveState/restoreState here: the
+    # dot pass below sets every attribute the outline touched.
+    if len(dot_list) < 3:
+        logger.warning("Not enough dots to draw outline: %d < 3", len(dot_list))
+    else:
+        logger.debug("Drawing dashed outline for shape '%s' with %d dots", shape, len(dot_list))
+
+        # Set dashed line style - lighter and more visible
+        c.setDash(8, 8)  # 8px dash, 8px gap
+        c.setStrokeGray(0.5)  # Medium gray
+        c.setLineWidth(1.5)
+
+        # Draw path connecting all dots
+        path = c.beginPath()
+        path.moveTo(*dot_list[0])
+        line_to = path.lineTo
+        for x, y in islice(dot_list, 1, None):
+            line_to(x, y)
+        path.close()
+        c.drawPath(path, stroke=1, fill=0)
 
     # Reset to solid line and black for dots
     c.setDash()  # Remove dash pattern
@@ -83,22 +73,27 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     c.setFillColor(colors.white)  # White fill for better visibility
     c.setLineWidth(2)
 
-    # Use larger font for numbers - easier for kids to see
-    c.setFont("Helvetica-Bold", 18)
-
     # Draw numbered dots - MUCH LARGER for kids
     circle_radius = 14  # Larger circles (was 4)
 
-    logger.debug(f"Drawing dots with radius={circle_radius}, font=18pt")
+    logger.debug("Drawing dots with radius=%s, font=18pt", circle_radius)
 
-    for i, (x, y) in enumerate(dot_list[:dots_count], start=1):
-        # Draw large hollow circle with thick border
-        c.circle(x, y, circle_radius, stroke=1, fill=1)
+    numbered = dot_list[:dots_count]
+    if numbered:
+        # Draw all large hollow circles with thick borders as one path
+        path = c.beginPath()
+        for x, y in numbered:
+            path.circle(x, y, circle_radius)
+        c.drawPath(path, stroke=1, fill=1)
 
-        # Draw number inside the circle (centered)
+        # Draw numbers inside the circles (centered). Use larger font for
+        # numbers - easier for kids to see; set once for the whole pass.
+        c.setFont("Helvetica-Bold", 18)
         c.setFillColor(colors.black)
-        # Adjust y position to center text vertically in circle
-        c.drawCentredString(x, y - 6, str(i))
+        draw_centred = c.drawCentredString
+        for i, (x, y) in enumerate(numbered, start=1):
+            # Adjust y position to center text vertically in circle
+            draw_centred(x, y - 6, str(i))
         c.setFillColor(colors.white)  # Reset fill color
 
-    logger.info("Dot-to-dot page rendering complete")
+    logger.debug("Dot-to-dot page rendering complete")
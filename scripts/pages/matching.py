@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 import random
+from pathlib import Path
 from typing import Any, Dict, Sequence
 
 from reportlab.lib import colors
 from reportlab.pdfgen.canvas import Canvas
-from reportlab.graphics import renderPDF
-from reportlab.lib.utils import ImageReader
-from svglib.svglib import svg2rlg
 
 from scripts.drawing.shapes import get_renderer
 from scripts.helpers import RenderContext, constants
-from scripts.assets import normalize_slug
+from scripts.assets import load_image, load_svg_drawing, normalize_slug
 
 
 logger = logging.getLogger(__name__)
 
 
+# Shape names repeat across items and pages; resolve each one only once
+_get_renderer = functools.lru_cache(maxsize=256)(get_renderer)
+
+# Color items reuse a handful of hex strings; parse each one once
+_hex_color = functools.lru_cache(maxsize=128)(colors.HexColor)
+_PLACEHOLDER_COLOR = colors.HexColor("#FF69B4")
+_BLACK = colors.black
+
+# Number of pairs that fit on one page
+_MAX_PAIRS = 4
+
 _COMMON_ANIMAL_SLUGS = {
     "alpaca": "alpaca",
     "bear": "bear-head",
@@ -60,18 +71,34 @@ _COMMON_ANIMAL_SLUGS = {
 }
 
 
+def _shape_form_name(c: Canvas, renderer: Any, size: float) -> str:
+    """Return the name of a Form XObject holding ``renderer`` at ``size``, defining it on first use."""
+
+    name = "shape-" + normalize_slug(f"{renderer.__module__}-{renderer.__qualname__}-{size:g}")
+    if not c.hasForm(name):
+        # Library shapes are bare geometry, so the form inherits stroke and
+        # line width from wherever it is placed
+        c.beginForm(name, lowerx=-size, lowery=-size, upperx=2 * size, uppery=2 * size)
+        try:
+            renderer(c, size, size)
+        finally:
+            c.endForm()
+    return name
+
+
 def _draw_shape_from_library(c: Canvas, x: float, y: float, shape_name: str, size: float = 50) -> None:
     """Draw a shape from the shape library, centered at (x, y)."""
-    renderer = get_renderer(shape_name)
+    renderer = _get_renderer(shape_name)
     if renderer:
-        logger.debug(f"Drawing shape from library: {shape_name} at ({x}, {y}), size={size}")
-        # Save state and translate to create centered box
+        logger.debug("Drawing shape from library: %s at (%s, %s), size=%s", shape_name, x, y, size)
+        # Repeated shapes on a page (and across pages) share one form
+        form_name = _shape_form_name(c, renderer, size)
         c.saveState()
         c.translate(x - size / 2, y - size / 2)
-        renderer(c, size, size)
+        c.doForm(form_name)
         c.restoreState()
     else:
-        logger.warning(f"Shape renderer not found for '{shape_name}', using fallback circle")
+        logger.warning("Shape renderer not found for '%s', using fallback circle", shape_name)
         # Fallback to circle
         c.circle(x, y, size / 2, stroke=1, fill=0)
 
@@ -82,12 +109,44 @@ def _draw_initial_placeholder(c: Canvas, x: float, y: float, name: str, size: fl
     letter = (name or "?").strip()[:1].upper() or "?"
     font_size = max(28, size * 0.75)
     c.saveState()
-    c.setFillColor(colors.HexColor("#FF69B4"))
+    c.setFillColor(_PLACEHOLDER_COLOR)
     c.setFont("Helvetica-Bold", font_size)
     c.drawCentredString(x, y - font_size / 3, letter)
     c.restoreState()
 
 
+@functools.lru_cache(maxsize=256)
+def _form_name_for(asset_path: Path) -> str:
+    """Form XObject name for an asset: a readable slug plus a hash of its resolved path.
+
+    The slug alone is not unique (paths differing only in case or punctuation
+    slug the same), so the hash keeps one icon from reusing another's form.
+    """
+    resolved = str(asset_path.resolve())
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:12]
+    return f"svg-{normalize_slug(asset_path.stem)}-{digest}"
+
+
+def _svg_form_name(c: Canvas, asset_path: Path, drawing: Any) -> str:
+    """Return the name of a Form XObject holding ``drawing``, defining it on first use."""
+
+    name = _form_name_for(asset_path)
+    if not c.hasForm(name):
+        # Imported here, as in the coloring renderer, so loading the page
+        # modules does not pull in reportlab.graphics
+        from reportlab.graphics import renderPDF
+
+        # The form bbox clips; leave generous room for strokes and content
+        # that spills past the SVG viewport, as direct drawing would show it
+        width, height = drawing.width, drawing.height
+        c.beginForm(name, lowerx=-width, lowery=-height, upperx=2 * width, uppery=2 * height)
+        try:
+            renderPDF.draw(drawing, c, 0, 0)
+        finally:
+            c.endForm()
+    return name
+
+
 def _draw_svg_asset(
     c: Canvas,
     ctx: RenderContext,
@@ -95,45 +154,72 @@ def _draw_svg_asset(
     y: float,
     asset_name: str,
     size: float = 50,
+    slug: str | None = None,
+    asset_path: Path | None = None,
 ) -> None:
-    """Draw an external asset via the shared context lookup."""
+    """Draw an external asset via the shared context lookup.
+
+    Pass ``slug`` when the caller has already normalized ``asset_name``, or
+    ``asset_path`` when it has already resolved the asset.
+    """
 
     if not asset_name:
         logger.debug("No asset name provided; falling back to shape library")
         _draw_shape_from_library(c, x, y, "circle", size)
         return
 
-    slug = normalize_slug(asset_name)
-    asset_path = ctx.asset_lookup(slug) or ctx.asset_lookup(asset_name)
+    if asset_path is None:
+        if slug is None:
+            slug = normalize_slug(asset_name)
+        asset_path = ctx.asset_lookup(slug)
 
     if not asset_path:
-        logger.debug(f"Asset '{asset_name}' not found via context lookup; trying shape library")
+        logger.debug("Asset '%s' not found via context lookup; trying shape library", asset_name)
         _draw_shape_from_library(c, x, y, asset_name, size)
         return
 
     try:
         suffix = asset_path.suffix.lower()
         if suffix == ".svg":
-            drawing = svg2rlg(str(asset_path))
+            drawing = load_svg_drawing(asset_path)
             if drawing:
                 scale = min(size / drawing.width, size / drawing.height)
                 logger.debug(
-                    f"Rendering SVG '{asset_name}' from {asset_path} at ({x}, {y}), scale={scale:.2f}"
+                    "Rendering SVG '%s' from %s at (%s, %s), scale=%.2f",
+                    asset_name,
+                    asset_path,
+                    x,
+                    y,
+                    scale,
                 )
+                # Draw through a Form XObject so repeated icons share one
+                # operator stream in the PDF
+                form_name = _svg_form_name(c, asset_path, drawing)
                 c.saveState()
-                c.translate(x - (drawing.width * scale) / 2, y - (drawing.height * scale) / 2)
+                # Rounded so the cm operator doesn't carry six-digit noise
+                scale = round(scale, 3)
+                c.translate(
+                    round(x - (drawing.width * scale) / 2, 2),
+                    round(y - (drawing.height * scale) / 2, 2),
+                )
                 c.scale(scale, scale)
-                renderPDF.draw(drawing, c, 0, 0)
+                c.doForm(form_name)
                 c.restoreState()
                 return
         elif suffix in {".png", ".jpg", ".jpeg"}:
-            image = ImageReader(str(asset_path))
+            image = load_image(asset_path)
             width, height = image.getSize()
             scale = min(size / width, size / height)
             render_width = width * scale
             render_height = height * scale
             logger.debug(
-                f"Rendering raster '{asset_name}' from {asset_path} at ({x}, {y}) sized {render_width:.1f}x{render_height:.1f}"
+                "Rendering raster '%s' from %s at (%s, %s) sized %.1fx%.1f",
+                asset_name,
+                asset_path,
+                x,
+                y,
+                render_width,
+                render_height,
             )
             c.drawImage(
                 image,
@@ -147,14 +233,16 @@ def _draw_svg_asset(
             )
             return
         else:
-            logger.warning(f"Unsupported asset type '{asset_path.suffix}' for '{asset_name}'")
+            logger.warning("Unsupported asset type '%s' for '%s'", asset_path.suffix, asset_name)
     except Exception as exc:
-        logger.error(f"Failed to render asset '{asset_name}' from {asset_path}: {exc}")
+        logger.error("Failed to render asset '%s' from %s: %s", asset_name, asset_path, exc)
         _draw_initial_placeholder(c, x, y, asset_name, size)
         return
 
     # If the asset couldn't be rendered (e.g., empty SVG), fall back to initial placeholder
-    logger.warning(f"Asset '{asset_name}' from {asset_path} could not be rendered; drawing initial instead")
+    logger.warning(
+        "Asset '%s' from %s could not be rendered; drawing initial instead", asset_name, asset_path
+    )
     _draw_initial_placeholder(c, x, y, asset_name, size)
 
 
@@ -175,7 +263,7 @@ def _draw_matching_item(
     """Draw a matching item - supports shapes, SVG assets, numbers, colors, and animals."""
     if isinstance(item, dict):
         item_type = item.get("type", "shape")
-        logger.debug(f"Drawing matching item type '{item_type}': {item}")
+        logger.debug("Drawing matching item type '%s': %s", item_type, item)
 
         if item_type == "shape":
             _draw_shape(c, ctx, x, y, item.get("shape", "circle"), size)
@@ -183,7 +271,7 @@ def _draw_matching_item(
             # Handle animal type - Claude uses either "name" or "animal" as key
             animal_name = item.get("name") or item.get("animal", "circle")
             slug = normalize_slug(animal_name)
-            logger.debug(f"Drawing animal '{animal_name}' (slug '{slug}')")
+            logger.debug("Drawing animal '%s' (slug '%s')", animal_name, slug)
 
             candidate_slugs = [slug]
             mapped_slug = _COMMON_ANIMAL_SLUGS.get(slug)
@@ -196,47 +284,50 @@ def _draw_matching_item(
                 asset_path = ctx.asset_lookup(asset_slug)
                 if asset_path:
                     logger.debug(
-                        f"Found animal asset '{asset_slug}' for '{animal_name}' at {asset_path}"
+                        "Found animal asset '%s' for '%s' at %s", asset_slug, animal_name, asset_path
                     )
-                    _draw_svg_asset(c, ctx, x, y, asset_slug, size)
+                    _draw_svg_asset(c, ctx, x, y, asset_slug, size, asset_path=asset_path)
                     break
             else:
                 logger.debug(
-                    f"Animal asset not found for '{animal_name}', falling back to generic handling"
+                    "Animal asset not found for '%s', falling back to generic handling", animal_name
                 )
-                _draw_svg_asset(c, ctx, x, y, animal_name, size)
+                _draw_svg_asset(c, ctx, x, y, animal_name, size, slug=slug)
         elif item_type == "number":
             c.setFont("Helvetica-Bold", 36)
             c.drawCentredString(x, y - 12, str(item.get("value", "1")))
         elif item_type == "color":
             try:
-                c.setFillColor(colors.HexColor(item.get("color", "#000000")))
+                c.setFillColor(_hex_color(item.get("color", "#000000")))
                 c.circle(x, y, size / 2, stroke=1, fill=1)
             except Exception as e:
-                logger.error(f"Failed to render color {item.get('color')}: {e}")
+                logger.error("Failed to render color %s: %s", item.get("color"), e)
                 c.circle(x, y, size / 2, stroke=1, fill=0)
             finally:
-                c.setFillColor(colors.black)
+                c.setFillColor(_BLACK)
         elif item_type == "asset":
             # Direct asset reference
             _draw_svg_asset(c, ctx, x, y, item.get("name", "circle"), size)
         else:
             # Unknown type - log warning and try to render as text
-            logger.warning(f"Unknown item type '{item_type}', treating as text")
+            logger.warning("Unknown item type '%s', treating as text", item_type)
             c.setFont("Helvetica-Bold", 24)
             c.drawCentredString(x, y - 8, str(item_type))
     else:
         # Plain string - try to interpret as shape/asset name first
         item_str = str(item)
-        # Check if it's a known shape or asset
-        slug = normalize_slug(item_str)
-        asset_path = ctx.asset_lookup(slug) or ctx.asset_lookup(item_str)
-        if asset_path or get_renderer(item_str):
-            logger.debug(f"Rendering plain string '{item_str}' as shape/asset")
-            _draw_shape(c, ctx, x, y, item_str, size)
+        # Check if it's a known asset or shape, resolving each only once and
+        # dispatching straight to the matching drawer
+        asset_path = ctx.asset_lookup(normalize_slug(item_str))
+        if asset_path:
+            logger.debug("Rendering plain string '%s' as asset", item_str)
+            _draw_svg_asset(c, ctx, x, y, item_str, size, asset_path=asset_path)
+        elif _get_renderer(item_str):
+            logger.debug("Rendering plain string '%s' as shape", item_str)
+            _draw_shape_from_library(c, x, y, item_str, size)
         else:
             # Otherwise render as text
-            logger.debug(f"Rendering plain string '{item_str}' as text")
+            logger.debug("Rendering plain string '%s' as text", item_str)
             c.setFont("Helvetica-Bold", 36)
             c.drawCentredString(x, y - 12, item_str)
 
@@ -247,7 +338,7 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
 
     Refactored to use typed RenderContext and constants.
     """
-    logger.info(f"Rendering matching page: {page_spec.get('title', 'Match the Pairs')}")
+    logger.info("Rendering matching page: %s", page_spec.get("title", "Match the Pairs"))
 
     # Draw page frame
     ctx.draw_border()
@@ -256,7 +347,7 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
 
     # Get pairs configuration
     pairs: Sequence[Any] = page_spec.get("pairs", [])
-    logger.info(f"Rendering {len(pairs)} pairs")
+    logger.info("Rendering %d pairs", len(pairs))
 
     # Use constants for layout
     left_x = ctx.width * 0.25
@@ -269,28 +360,49 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     c.setLineWidth(max(2, ctx.kid_stroke_width - 2))
     c.setStrokeColor(colors.black)
 
-    # Shuffle right items for matching activity
-    paired_types = (list, tuple)
-    right_items = [pair[1] if isinstance(pair, paired_types) else pair for pair in pairs]
+    # Only 4 pairs fit on the page; drop the rest before any per-pair work
+    if len(pairs) > _MAX_PAIRS:
+        logger.debug("Limiting to %d pairs (skipping remaining %d)", _MAX_PAIRS, len(pairs) - _MAX_PAIRS)
+        pairs = pairs[:_MAX_PAIRS]
+
+    # Split pairs into left/right columns in one pass, then shuffle the right
+    left_items = []
+    right_items = []
+    for pair in pairs:
+        if isinstance(pair, (list, tuple)):
+            left_items.append(pair[0])
+            right_items.append(pair[1])
+        else:
+            left_items.append(pair)
+            right_items.append(pair)
     random.shuffle(right_items)
 
-    # Draw matching pairs (limit to 4 to fit on page)
-    for i, pair in enumerate(pairs):
-        if i >= 4:
-            logger.debug(f"Limiting to 4 pairs (skipping remaining {len(pairs) - 4})")
-            break
+    # Bind loop-invariant lookups once
+    draw_item = _draw_matching_item
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
+    # Connection dots for every pair are collected into one path and
+    # stroked once after the items
+    dots = c.beginPath()
+    dot_left_x = round(left_x + 45, 2)
+    dot_right_x = round(right_x - 45, 2)
+
+    # Draw matching pairs
+    for i, (left_item, right_item) in enumerate(zip(left_items, right_items)):
         y = start_y - i * spacing
-        left_item = pair[0] if isinstance(pair, paired_types) else pair
-        logger.debug(f"Pair {i+1}: left={left_item}, right={right_items[i] if i < len(right_items) else 'none'}")
+        if debug_enabled:
+            logger.debug("Pair %d: left=%s, right=%s", i + 1, left_item, right_item)
 
         # Draw items
-        _draw_matching_item(c, ctx, left_x, y, left_item, item_size)
-        if i < len(right_items):
-            _draw_matching_item(c, ctx, right_x, y, right_items[i], item_size)
+        draw_item(c, ctx, left_x, y, left_item, item_size)
+        draw_item(c, ctx, right_x, y, right_item, item_size)
+
+        # Add connection dots
+        y = round(y, 2)
+        dots.circle(dot_left_x, y, 5)
+        dots.circle(dot_right_x, y, 5)
 
-        # Draw connection dots
-        c.circle(left_x + 45, y, 5, stroke=1, fill=0)
-        c.circle(right_x - 45, y, 5, stroke=1, fill=0)
+    if left_items:
+        c.drawPath(dots, stroke=1, fill=0)
 
     logger.info("Matching page rendering complete")
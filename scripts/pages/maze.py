@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
 import random
-from typing import Any, Dict, Set, Tuple
+from typing import Any, Dict, Iterator, Tuple
 
 from reportlab.lib import colors
 from reportlab.pdfgen.canvas import Canvas
@@ -14,117 +16,151 @@ from scripts.helpers import RenderContext, constants
 
 logger = logging.getLogger(__name__)
 
+# Carve directions as (dx, dy, name), and all 24 orders to try them in
+_DIRS = ((1, 0, 'right'), (0, 1, 'down'), (-1, 0, 'left'), (0, -1, 'up'))
+_DIR_PERMS = tuple(itertools.permutations(range(len(_DIRS))))
 
-def _generate_simple_maze(grid_size: int, seed: int = None) -> Set[Tuple[int, int, str]]:
+
+def _generate_simple_maze(grid_size: int, seed: int = None) -> Tuple[bytearray, bytearray]:
     """Generate a simple maze for toddlers using DFS.
 
     Args:
         grid_size: Size of the maze grid (NxN)
-        seed: Random seed for reproducibility
+        seed: Random seed for reproducibility; the maze is carved with its
+            own ``random.Random`` so the global random state is untouched
 
     Returns:
-        Set of (x, y, direction) tuples representing walls to REMOVE
-        where direction is 'right' (remove wall to the right of cell)
-        or 'down' (remove wall below cell)
+        (remove_right, remove_down) masks indexed by ``y * grid_size + x``;
+        a non-zero entry means the wall to the right of / below that cell
+        is REMOVED
     """
+    rng = random.Random(seed)
     if seed is not None:
-        random.seed(seed)
-        logger.debug(f"Generating maze with seed={seed}, grid_size={grid_size}")
-
-    # Track visited cells
-    visited: Set[Tuple[int, int]] = set()
-    walls_to_remove: Set[Tuple[int, int, str]] = set()
-
-    def get_unvisited_neighbors(x: int, y: int) -> list[Tuple[int, int, str]]:
-        """Get unvisited neighbors of cell (x, y)."""
-        neighbors = []
-        # Right
-        if x < grid_size - 1 and (x + 1, y) not in visited:
-            neighbors.append((x + 1, y, 'right'))
-        # Down
-        if y < grid_size - 1 and (x, y + 1) not in visited:
-            neighbors.append((x, y + 1, 'down'))
-        # Left
-        if x > 0 and (x - 1, y) not in visited:
-            neighbors.append((x - 1, y, 'left'))
-        # Up
-        if y > 0 and (x, y - 1) not in visited:
-            neighbors.append((x, y - 1, 'up'))
-        return neighbors
-
-    def carve_path(x: int, y: int) -> None:
-        """Recursively carve paths through the maze using DFS."""
-        visited.add((x, y))
-
-        # Get neighbors in random order
-        neighbors = get_unvisited_neighbors(x, y)
-        random.shuffle(neighbors)
-
-        for nx, ny, direction in neighbors:
-            if (nx, ny) not in visited:
-                # Remove wall between current cell and neighbor
-                if direction == 'right':
-                    walls_to_remove.add((x, y, 'right'))
-                elif direction == 'down':
-                    walls_to_remove.add((x, y, 'down'))
-                elif direction == 'left':
-                    walls_to_remove.add((nx, ny, 'right'))
-                elif direction == 'up':
-                    walls_to_remove.add((nx, ny, 'down'))
-
-                # Recursively carve from neighbor
-                carve_path(nx, ny)
-
-    # Start from top-left (0, 0)
-    carve_path(0, 0)
-
-    logger.info(f"Generated maze: {len(visited)} cells visited, {len(walls_to_remove)} walls removed")
-    logger.debug(f"Walls removed: {walls_to_remove}")
-
-    return walls_to_remove
+        logger.debug("Generating maze with seed=%s, grid_size=%s", seed, grid_size)
+
+    # Track visited cells, indexed like the wall masks
+    visited = bytearray(grid_size * grid_size)
+    remove_right = bytearray(grid_size * grid_size)
+    remove_down = bytearray(grid_size * grid_size)
+
+    # Iterative DFS: each stack entry is a cell and an iterator over one of
+    # the precomputed direction orders, picked with a single randrange
+    # instead of building and shuffling a neighbor list per cell
+    stack: list[Tuple[int, int, Iterator[int]]] = []
+
+    # Bind the hot-loop lookups to locals once
+    randrange = rng.randrange
+    push, pop = stack.append, stack.pop
+    dirs, perms, perm_count = _DIRS, _DIR_PERMS, len(_DIR_PERMS)
+
+    x, y = 0, 0  # Start from top-left (0, 0)
+    visited[0] = 1
+    push((x, y, iter(perms[randrange(perm_count)])))
+    while stack:
+        # Find the next neighbor still unvisited, backtracking as needed
+        x, y, pending = stack[-1]
+        for idx in pending:
+            dx, dy, direction = dirs[idx]
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < grid_size and 0 <= ny < grid_size and not visited[ny * grid_size + nx]:
+                break
+        else:
+            pop()
+            continue
+
+        # Remove wall between current cell and neighbor
+        if direction == 'right':
+            remove_right[y * grid_size + x] = 1
+        elif direction == 'down':
+            remove_down[y * grid_size + x] = 1
+        elif direction == 'left':
+            remove_right[ny * grid_size + nx] = 1
+        elif direction == 'up':
+            remove_down[ny * grid_size + nx] = 1
+
+        # Carve on from the neighbor
+        visited[ny * grid_size + nx] = 1
+        push((nx, ny, iter(perms[randrange(perm_count)])))
+
+    logger.info(
+        "Generated maze: %d cells visited, %d walls removed",
+        sum(visited), sum(remove_right) + sum(remove_down),
+    )
 
+    return remove_right, remove_down
+
+
+WallRun = Tuple[int, int, int, int]
 
-def _draw_maze_grid(c: Canvas, grid_size: int, start_x: float, start_y: float,
-                    cell_size: float, walls_to_remove: Set[Tuple[int, int, str]]) -> None:
-    """Draw a maze grid with walls."""
-    logger.debug(f"Drawing maze grid: grid_size={grid_size}, cell_size={cell_size}")
 
-    horizontal_walls = 0
-    vertical_walls = 0
+def _collect_wall_runs(grid_size: int, walls_to_remove: Tuple[bytes, bytes]) -> Tuple[WallRun, ...]:
+    """Merge the remaining maze walls into straight runs.
 
-    # Draw all horizontal lines (except where walls are removed)
+    Returns:
+        ``(x1, y1, x2, y2)`` runs in grid-line units, where x counts columns
+        from the left and y counts rows from the top; horizontal runs first
+    """
+    remove_right, remove_down = walls_to_remove
+    runs: list[WallRun] = []
+
+    # Horizontal lines (except where walls are removed)
     for y in range(grid_size + 1):
-        for x in range(grid_size):
-            # Check if this horizontal wall should be drawn
-            # Horizontal walls are below cells, so check if (x, y-1, 'down') is in walls_to_remove
-            should_draw = True
-            if y > 0 and y < grid_size and (x, y - 1, 'down') in walls_to_remove:
-                should_draw = False
-
-            if should_draw:
-                x1 = start_x + x * cell_size
-                x2 = start_x + (x + 1) * cell_size
-                y_pos = start_y - y * cell_size
-                c.line(x1, y_pos, x2, y_pos)
-                horizontal_walls += 1
-
-    # Draw all vertical lines (except where walls are removed)
+        run_start = None
+        for x in range(grid_size + 1):
+            # Horizontal walls are below cells, so check remove_down for cell (x, y-1)
+            is_wall = x < grid_size and not (
+                0 < y < grid_size and remove_down[(y - 1) * grid_size + x]
+            )
+            if is_wall:
+                if run_start is None:
+                    run_start = x
+            elif run_start is not None:
+                runs.append((run_start, y, x, y))
+                run_start = None
+
+    # Vertical lines (except where walls are removed)
     for x in range(grid_size + 1):
-        for y in range(grid_size):
-            # Check if this vertical wall should be drawn
-            # Vertical walls are to the right of cells, so check if (x-1, y, 'right') is in walls_to_remove
-            should_draw = True
-            if x > 0 and x < grid_size and (x - 1, y, 'right') in walls_to_remove:
-                should_draw = False
+        run_start = None
+        for y in range(grid_size + 1):
+            # Vertical walls are to the right of cells, so check remove_right for cell (x-1, y)
+            is_wall = y < grid_size and not (
+                0 < x < grid_size and remove_right[y * grid_size + x - 1]
+            )
+            if is_wall:
+                if run_start is None:
+                    run_start = y
+            elif run_start is not None:
+                runs.append((x, run_start, x, y))
+                run_start = None
+
+    return tuple(runs)
 
-            if should_draw:
-                y1 = start_y - y * cell_size
-                y2 = start_y - (y + 1) * cell_size
-                x_pos = start_x + x * cell_size
-                c.line(x_pos, y1, x_pos, y2)
-                vertical_walls += 1
 
-    logger.debug(f"Drew {horizontal_walls} horizontal walls and {vertical_walls} vertical walls")
+@functools.lru_cache(maxsize=128)
+def _generate_maze_walls(grid_size: int, seed: int) -> Tuple[WallRun, ...]:
+    """Generate a maze and return its merged wall runs, cached by size and seed."""
+    return _collect_wall_runs(grid_size, _generate_simple_maze(grid_size, seed))
+
+
+def _draw_maze_grid(c: Canvas, grid_size: int, start_x: float, start_y: float,
+                    cell_size: float, runs: Tuple[WallRun, ...]) -> None:
+    """Draw a maze grid with walls.
+
+    Every merged wall run goes into one path that is stroked once.
+    """
+    logger.debug("Drawing maze grid: grid_size=%s, cell_size=%s", grid_size, cell_size)
+
+    # Grid line coordinates along each axis, computed once and indexed below
+    xs = [start_x + i * cell_size for i in range(grid_size + 1)]
+    ys = [start_y - i * cell_size for i in range(grid_size + 1)]
+
+    path = c.beginPath()
+    for x1, y1, x2, y2 in runs:
+        path.moveTo(xs[x1], ys[y1])
+        path.lineTo(xs[x2], ys[y2])
+    c.drawPath(path, stroke=1, fill=0)
+
+    logger.debug("Drew %d wall runs", len(runs))
 
 
 def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
@@ -134,7 +170,7 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     Refactored to use typed RenderContext and constants.
     """
     title = page_spec.get("title", "Maze")
-    logger.info(f"Rendering maze page: {title}")
+    logger.info("Rendering maze page: %s", title)
 
     # Draw page frame
     ctx.draw_border()
@@ -157,14 +193,16 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
         maze_size = page_spec.get("maze_size", 5)
         cell_size = page_spec.get("cell_size", constants.GRID_SPACING_SMALL)
 
-    logger.info(f"Maze difficulty: {difficulty}, size: {maze_size}x{maze_size}, cell_size: {cell_size}px")
+    logger.info(
+        "Maze difficulty: %s, size: %sx%s, cell_size: %spx", difficulty, maze_size, maze_size, cell_size
+    )
 
     # Generate unique maze using page title hash as seed
     seed = abs(hash(title)) % 10000
-    logger.debug(f"Using seed {seed} (from hash of '{title}')")
+    logger.debug("Using seed %s (from hash of '%s')", seed, title)
 
-    # Generate maze
-    walls_to_remove = _generate_simple_maze(maze_size, seed)
+    # Generate maze walls (reused when the same size and seed come round again)
+    wall_runs = _generate_maze_walls(maze_size, seed)
 
     # Center the maze on the canvas
     start_x = ctx.center_x - (maze_size * cell_size) / 2
@@ -175,7 +213,7 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     c.setStrokeColor(colors.black)
 
     # Draw maze grid
-    _draw_maze_grid(c, maze_size, start_x, start_y, cell_size, walls_to_remove)
+    _draw_maze_grid(c, maze_size, start_x, start_y, cell_size, wall_runs)
 
     # Draw START marker (green circle)
     c.setFillColor(colors.green)
@@ -8,58 +8,26 @@ from typing import Any, Dict
 
 from reportlab.pdfgen.canvas import Canvas
 
-from scripts.drawing.shapes import get_renderer, RENDERERS
+from scripts.drawing.shapes import get_renderer, RENDERERS, SYNONYMS
 from scripts.helpers import RenderContext, constants
 
 
 logger = logging.getLogger(__name__)
 
+# Every name get_renderer resolves to a real shape (not its circle fallback)
+_SHAPE_NAMES = frozenset(k.lower() for k in RENDERERS) | frozenset(k.lower() for k in SYNONYMS)
+
 
 def _is_shape(content: str) -> bool:
     """Check if content is a known shape name."""
-    normalized = content.lower().strip()
-    return normalized in RENDERERS or get_renderer(content) is not None
-
-
-def _draw_traceable_shape(c: Canvas, x: float, y: float, shape_name: str, size: float = 120) -> None:
-    """Draw a shape with dotted outline for tracing."""
-    renderer = get_renderer(shape_name)
-    if renderer:
-        logger.debug(f"Drawing traceable shape '{shape_name}' at ({x}, {y}), size={size}")
-        c.saveState()
-        # Set dotted line style
-        c.setDash(6, 6)
-        c.setStrokeGray(0.5)
-        c.setLineWidth(2)
-        # Translate so shapes are centered within the tracing cell
-        c.translate(x - size / 2, y - size / 2)
-        # Render the shape
-        renderer(c, size, size)
-        c.restoreState()
-    else:
-        logger.warning(f"No renderer found for shape '{shape_name}'")
+    return content.lower().strip() in _SHAPE_NAMES
 
 
-def _draw_traceable_text(c: Canvas, x: float, y: float, text: str, font_size: int = 96) -> None:
-    """Draw text with dotted outline (stroke-only) for tracing."""
-    logger.debug(f"Drawing traceable text '{text}' at ({x}, {y}), font_size={font_size}")
-    c.saveState()
-
-    # Set font
-    c.setFont("Helvetica-Bold", font_size)
-
-    # Use text render mode 1 = stroke only (no fill)
-    c.setTextRenderMode(1)
-
-    # Set dotted line style
+def _set_tracing_stroke(c: Canvas, line_width: float) -> None:
+    """Set the dotted grey stroke used for every tracing outline."""
     c.setDash(6, 6)
     c.setStrokeGray(0.5)
-    c.setLineWidth(2.5)  # Thinner stroke for tracing
-
-    # Draw the text
-    c.drawString(x, y, text)
-
-    c.restoreState()
+    c.setLineWidth(line_width)
 
 
 def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
@@ -72,8 +40,8 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     content = page_spec.get("content", "A")
     repetitions = page_spec.get("repetitions", constants.DEFAULT_TRACING_REPETITIONS)
 
-    logger.info(f"Rendering tracing page: {title}")
-    logger.info(f"Content: '{content}', repetitions: {repetitions}")
+    logger.info("Rendering tracing page: %s", title)
+    logger.info("Content: '%s', repetitions: %s", content, repetitions)
 
     # Draw page frame
     ctx.draw_border()
@@ -82,7 +50,7 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
 
     # Check if content is a shape or text
     is_shape = _is_shape(str(content))
-    logger.info(f"Content type: {'shape' if is_shape else 'text'}")
+    logger.info("Content type: %s", "shape" if is_shape else "text")
 
     # Calculate grid layout using constants
     cols = constants.DEFAULT_TRACING_COLS
@@ -91,23 +59,43 @@ def render(c: Canvas, page_spec: Dict[str, Any], ctx: RenderContext) -> None:
     spacing_x = (ctx.width - 2 * ctx.margin) / cols
     spacing_y = (ctx.height - 250) / rows  # 250 is buffer for title/instruction
 
-    logger.debug(f"Layout: {cols} cols x {rows} rows, spacing_x={spacing_x:.1f}, spacing_y={spacing_y:.1f}")
-
-    # Draw tracing items
-    for row in range(rows):
-        for col in range(cols):
-            if row * cols + col >= repetitions:
-                break
-
-            if is_shape:
-                # Draw shape with dotted outline
-                x = ctx.margin + col * spacing_x + spacing_x / 2
-                y = start_y - row * spacing_y - 50
-                _draw_traceable_shape(c, x, y, str(content), size=120)
-            else:
-                # Draw text with dotted outline (stroke-only)
-                x = ctx.margin + col * spacing_x + spacing_x / 2 - 35
-                y = start_y - row * spacing_y
-                _draw_traceable_text(c, x, y, str(content), font_size=constants.FONT_SIZE_TRACING_LARGE)
+    logger.debug(
+        "Layout: %d cols x %d rows, spacing_x=%.1f, spacing_y=%.1f", cols, rows, spacing_x, spacing_y
+    )
+
+    # Cell centres along each axis, computed once and indexed below
+    col_xs = [ctx.margin + col * spacing_x + spacing_x / 2 for col in range(cols)]
+    row_ys = [start_y - row * spacing_y for row in range(rows)]
+
+    # Draw tracing items. The dotted style is set once for the whole grid
+    # inside a single saveState/restoreState instead of once per item.
+    c.saveState()
+    if is_shape:
+        renderer = get_renderer(str(content))
+        size = 120
+        _set_tracing_stroke(c, 2)
+        for i in range(repetitions):
+            row, col = divmod(i, cols)
+            # Translate so shapes are centered within the tracing cell
+            x = col_xs[col]
+            y = row_ys[row] - 50
+            c.saveState()
+            c.translate(x - size / 2, y - size / 2)
+            renderer(c, size, size)
+            c.restoreState()
+    else:
+        # Stroke-only text (render mode 1) for every item, drawn through one
+        # text object so the font and render mode are emitted once
+        _set_tracing_stroke(c, 2.5)  # Thinner stroke for tracing
+        text = str(content)
+        text_obj = c.beginText()
+        text_obj.setFont("Helvetica-Bold", constants.FONT_SIZE_TRACING_LARGE)
+        text_obj.setTextRenderMode(1)
+        for i in range(repetitions):
+            row, col = divmod(i, cols)
+            text_obj.setTextOrigin(col_xs[col] - 35, row_ys[row])
+            text_obj.textOut(text)
+        c.drawText(text_obj)
+    c.restoreState()
 
     logger.info("Tracing page rendering complete")
@@ -5,30 +5,38 @@ This script allows you to test each activity type independently
 and generate sample PDFs for verification.
 
 Usage:
-    python test_activities.py --all                    # Test all activities
+    python test_activities.py --all                    # Test all activities (one PDF)
+    python test_activities.py --all --split            # One PDF per activity
+    python test_activities.py --all --parallel         # ...rendered in worker processes
     python test_activities.py --activity matching      # Test specific activity
     python test_activities.py --activity maze --debug  # Test with debug logging
 """
 
 import argparse
+import functools
+import importlib
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.lib.pagesizes import letter
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-from scripts.pages import matching, maze, dot_to_dot, tracing
 from scripts.helpers import Primitives, RenderContext
 
 
+logger = logging.getLogger(__name__)
+
+
 # Configure logging
 def setup_logging(debug: bool = False):
-    """Setup logging configuration."""
+    """Setup logging configuration (only the first call has any effect)."""
+    if getattr(setup_logging, "_done", False):
+        return
     level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(
         level=level,
@@ -37,84 +45,104 @@ def setup_logging(debug: bool = False):
             logging.StreamHandler(sys.stdout)
         ]
     )
+    setup_logging._done = True
+
+
+# Dot-position generators by shape name, built once at import
+_SHAPE_GENERATORS: Dict[str, Callable[[float, float, int], List[Tuple[float, float]]]] = {
+    "star": Primitives.generate_dot_positions_star,
+    "circle": Primitives.generate_dot_positions_circle,
+    "heart": Primitives.generate_dot_positions_heart,
+    "square": Primitives.generate_dot_positions_square,
+    "triangle": Primitives.generate_dot_positions_triangle,
+    "diamond": Primitives.generate_dot_positions_diamond,
+    "house": Primitives.generate_dot_positions_house,
+    "tree": Primitives.generate_dot_positions_tree,
+    "flower": Primitives.generate_dot_positions_flower,
+    "butterfly": Primitives.generate_dot_positions_butterfly,
+    "fish": Primitives.generate_dot_positions_fish,
+    "apple": Primitives.generate_dot_positions_apple,
+}
+_DEFAULT_GENERATOR = Primitives.generate_dot_positions_circle
+
+
+@functools.lru_cache(maxsize=128)
+def _gen_positions(shape: str, num_dots: int, cx: float, cy: float) -> Tuple[Tuple[float, float], ...]:
+    """Generate dot positions for a shape, cached as an immutable tuple."""
+    generator = _SHAPE_GENERATORS.get(shape, _DEFAULT_GENERATOR)
+    return tuple(generator(cx, cy, num_dots))
 
 
 # Helper functions that mimic the actual generator helpers
-def create_render_context(c: Canvas, width: float, height: float, margin: float = 50) -> RenderContext:
-    """Create RenderContext for renderers."""
+class _CanvasHelpers:
+    """Page helpers bound to one canvas; its bound methods fill a RenderContext."""
 
-    def draw_border():
+    __slots__ = ("c", "width", "height", "margin")
+
+    def __init__(self, c: Canvas, width: float, height: float, margin: float):
+        self.c = c
+        self.width = width
+        self.height = height
+        self.margin = margin
+
+    def draw_border(self):
         """Draw page border."""
-        c.rect(margin, margin, width - 2 * margin, height - 2 * margin)
+        margin = self.margin
+        self.c.rect(margin, margin, self.width - 2 * margin, self.height - 2 * margin)
 
-    def draw_title(title: str, y_offset: int = 50):
+    def draw_title(self, title: str, y_offset: int = 50):
         """Draw page title."""
-        c.setFont("Helvetica-Bold", 24)
-        c.drawCentredString(width / 2, height - y_offset, title)
+        self.c.setFont("Helvetica-Bold", 24)
+        self.c.drawCentredString(self.width / 2, self.height - y_offset, title)
 
-    def draw_instruction(instruction: str, y_offset: int = 80):
+    def draw_instruction(self, instruction: str, y_offset: int = 80):
         """Draw instruction text."""
-        c.setFont("Helvetica", 14)
-        c.drawCentredString(width / 2, height - y_offset, instruction)
+        self.c.setFont("Helvetica", 14)
+        self.c.drawCentredString(self.width / 2, self.height - y_offset, instruction)
 
-    def prep_kid_lines():
+    def prep_kid_lines(self):
         """Prepare canvas for kid-friendly lines."""
-        c.setLineWidth(4)
+        self.c.setLineWidth(4)
 
-    def generate_dot_positions(shape: str, num_dots: int):
+    def generate_dot_positions(self, shape: str, num_dots: int):
         """Generate dot positions for dot-to-dot activity."""
-        center_x, center_y = width / 2, height / 2
-
-        generators = {
-            "star": Primitives.generate_dot_positions_star,
-            "circle": Primitives.generate_dot_positions_circle,
-            "heart": Primitives.generate_dot_positions_heart,
-            "square": Primitives.generate_dot_positions_square,
-            "triangle": Primitives.generate_dot_positions_triangle,
-            "diamond": Primitives.generate_dot_positions_diamond,
-            "house": Primitives.generate_dot_positions_house,
-            "tree": Primitives.generate_dot_positions_tree,
-            "flower": Primitives.generate_dot_positions_flower,
-            "butterfly": Primitives.generate_dot_positions_butterfly,
-            "fish": Primitives.generate_dot_positions_fish,
-            "apple": Primitives.generate_dot_positions_apple,
-        }
-
-        generator = generators.get(
-            str(shape or "circle").lower(), Primitives.generate_dot_positions_circle
-        )
-        return generator(center_x, center_y, num_dots)
+        return _gen_positions(str(shape or "circle").lower(), num_dots, self.width / 2, self.height / 2)
 
+    @staticmethod
     def asset_lookup(name):
         """Mock asset lookup."""
         return None
 
+
+def create_render_context(c: Canvas, width: float, height: float, margin: float = 50) -> RenderContext:
+    """Create RenderContext for renderers."""
+    helpers = _CanvasHelpers(c, width, height, margin)
     return RenderContext(
         canvas=c,
         width=width,
         height=height,
         margin=margin,
-        draw_border=draw_border,
-        draw_title=draw_title,
-        draw_instruction=draw_instruction,
-        prep_kid_lines=prep_kid_lines,
+        draw_border=helpers.draw_border,
+        draw_title=helpers.draw_title,
+        draw_instruction=helpers.draw_instruction,
+        prep_kid_lines=helpers.prep_kid_lines,
         kid_stroke_width=4,
-        generate_dot_positions=generate_dot_positions,
-        asset_lookup=asset_lookup,
+        generate_dot_positions=helpers.generate_dot_positions,
+        asset_lookup=helpers.asset_lookup,
     )
 
 
 # Sample page specifications for testing
-SAMPLE_PAGES = {
+_SAMPLE_PAGES_RAW = {
     "matching": {
         "title": "Test Match the Pairs",
         "type": "matching",
-        "pairs": [
-            [{"type": "shape", "shape": "star"}, {"type": "shape", "shape": "star"}],
-            [{"type": "shape", "shape": "heart"}, {"type": "shape", "shape": "heart"}],
-            [{"type": "shape", "shape": "circle"}, {"type": "shape", "shape": "circle"}],
-            ["apple", "apple"],
-        ]
+        "pairs": (
+            ({"type": "shape", "shape": "star"}, {"type": "shape", "shape": "star"}),
+            ({"type": "shape", "shape": "heart"}, {"type": "shape", "shape": "heart"}),
+            ({"type": "shape", "shape": "circle"}, {"type": "shape", "shape": "circle"}),
+            ("apple", "apple"),
+        )
     },
     "maze": {
         "title": "Test Maze Easy",
@@ -163,11 +191,64 @@ SAMPLE_PAGES = {
     }
 }
 
+# Read-only views of the sample specs. The dot-to-dot renderer caches its
+# generated positions on the spec it gets, so each render is handed its own
+# shallow dict copy and the shared samples never change.
+SAMPLE_PAGES = MappingProxyType(
+    {name: MappingProxyType(spec) for name, spec in _SAMPLE_PAGES_RAW.items()}
+)
+
+
+# Page module for each activity type, imported on first use
+_ACTIVITY_MODULES = {
+    "matching": "scripts.pages.matching",
+    "maze": "scripts.pages.maze",
+    "dot-to-dot": "scripts.pages.dot_to_dot",
+    "tracing": "scripts.pages.tracing",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_renderer(activity_type: str):
+    """Import the page module for an activity type and return its render function."""
+    module_name = _ACTIVITY_MODULES.get(activity_type)
+    if module_name is None:
+        return None
+    return importlib.import_module(module_name).render
+
+
+def _render_into(c: Canvas, ctx: RenderContext, activity_type: str, page_spec: Mapping[str, Any]) -> bool:
+    """Render one activity page onto an open canvas and finish the page.
+
+    Every call ends exactly one page, even when rendering fails, so a broken
+    renderer's partial drawing never leaks onto the next activity's page.
+    Does not save the canvas, so callers can put several pages in one PDF.
+    """
+    renderer = _load_renderer(activity_type)
+    depth = len(c.state_stack)
+    c.saveState()
+    try:
+        if renderer is None:
+            logger.error("Unknown activity type: %s", activity_type)
+            return False
+        renderer(c, dict(page_spec), ctx)
+        return True
+    except Exception as e:
+        logger.error("✗ Failed to render %s: %s", activity_type, e)
+        # The full traceback is only worth formatting when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Traceback for %s failure", activity_type, exc_info=True)
+        return False
+    finally:
+        # Unwind our save plus any the renderer left open when it raised
+        while len(c.state_stack) > depth:
+            c.restoreState()
+        c.showPage()
 
-def render_activity_page(activity_type: str, page_spec: dict, output_path: Path):
+
+def render_activity_page(activity_type: str, page_spec: Mapping[str, Any], output_path: Path):
     """Render a single activity page to PDF."""
-    logger = logging.getLogger(__name__)
-    logger.info(f"Rendering {activity_type} activity to {output_path}")
+    logger.info("Rendering %s activity to %s", activity_type, output_path)
 
     # Create PDF canvas
     width, height = letter
@@ -176,39 +257,20 @@ def render_activity_page(activity_type: str, page_spec: dict, output_path: Path)
     # Create RenderContext
     ctx = create_render_context(c, width, height)
 
-    # Render based on activity type
-    try:
-        if activity_type == "matching":
-            matching.render(c, page_spec, ctx)
-        elif activity_type == "maze":
-            maze.render(c, page_spec, ctx)
-        elif activity_type == "dot-to-dot":
-            dot_to_dot.render(c, page_spec, ctx)
-        elif activity_type == "tracing":
-            tracing.render(c, page_spec, ctx)
-        else:
-            logger.error(f"Unknown activity type: {activity_type}")
-            return False
-
-        # Save PDF
-        c.showPage()
-        c.save()
-        logger.info(f"✓ Successfully created: {output_path}")
-        return True
-
-    except Exception as e:
-        logger.error(f"✗ Failed to render {activity_type}: {e}", exc_info=True)
+    if not _render_into(c, ctx, activity_type, page_spec):
         return False
 
+    # Save PDF
+    c.save()
+    logger.info("✓ Successfully created: %s", output_path)
+    return True
 
-def test_activity(activity_name: str, debug: bool = False):
-    """Test a specific activity."""
-    setup_logging(debug)
-    logger = logging.getLogger(__name__)
 
+def _test_activity_inner(activity_name: str):
+    """Test a specific activity without touching logging setup."""
     if activity_name not in SAMPLE_PAGES:
-        logger.error(f"Unknown activity: {activity_name}")
-        logger.info(f"Available activities: {', '.join(SAMPLE_PAGES.keys())}")
+        logger.error("Unknown activity: %s", activity_name)
+        logger.info("Available activities: %s", ", ".join(SAMPLE_PAGES))
         return False
 
     page_spec = SAMPLE_PAGES[activity_name]
@@ -219,30 +281,73 @@ def test_activity(activity_name: str, debug: bool = False):
 
     output_path = output_dir / f"test_{activity_name}.pdf"
 
-    logger.info(f"Testing {activity_name} ({activity_type})")
+    logger.info("Testing %s (%s)", activity_name, activity_type)
     success = render_activity_page(activity_type, page_spec, output_path)
 
     if success:
-        logger.info(f"\n✓ Test passed! PDF created at: {output_path}")
+        logger.info("\n✓ Test passed! PDF created at: %s", output_path)
     else:
-        logger.error(f"\n✗ Test failed for {activity_name}")
+        logger.error("\n✗ Test failed for %s", activity_name)
 
     return success
 
 
-def test_all_activities(debug: bool = False):
-    """Test all activities."""
+def render_all_into_one(output_path: Path) -> Dict[str, bool]:
+    """Render every sample page into a single multi-page PDF.
+
+    Returns:
+        Mapping of activity name to whether its page rendered
+    """
+    logger.info("Rendering all activities to %s", output_path)
+
+    # One canvas and context for the whole document
+    width, height = letter
+    c = Canvas(str(output_path), pagesize=letter)
+    ctx = create_render_context(c, width, height)
+
+    results = {
+        activity_name: _render_into(c, ctx, page_spec["type"], page_spec)
+        for activity_name, page_spec in SAMPLE_PAGES.items()
+    }
+
+    c.save()
+    logger.info("✓ Created: %s", output_path)
+    return results
+
+
+def test_activity(activity_name: str, debug: bool = False):
+    """Test a specific activity."""
+    setup_logging(debug)
+    return _test_activity_inner(activity_name)
+
+
+def test_all_activities(debug: bool = False, split: bool = False, parallel: bool = False):
+    """Test all activities, as one PDF or (with ``split``) one PDF each.
+
+    With ``split`` and ``parallel`` the per-activity PDFs are rendered in
+    worker processes; otherwise everything runs in order in this process so
+    debug output stays deterministic.
+    """
     setup_logging(debug)
-    logger = logging.getLogger(__name__)
 
     logger.info("Testing all activities...")
     logger.info("=" * 60)
 
-    results = {}
-    for activity_name in SAMPLE_PAGES.keys():
-        logger.info(f"\nTesting: {activity_name}")
-        logger.info("-" * 60)
-        results[activity_name] = test_activity(activity_name, debug=False)
+    names = list(SAMPLE_PAGES)
+    if split and parallel:
+        # Each activity renders its own PDF with no shared state, so run them
+        # in worker processes; results come back in SAMPLE_PAGES order
+        max_workers = min(len(names), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=setup_logging, initargs=(debug,)
+        ) as executor:
+            results = dict(zip(names, executor.map(_test_activity_inner, names)))
+    elif split:
+        results = {name: _test_activity_inner(name) for name in names}
+    else:
+        output_dir = Path("test_output")
+        output_dir.mkdir(exist_ok=True)
+        results = render_all_into_one(output_dir / "test_all.pdf")
 
     # Summary
     logger.info("\n" + "=" * 60)
@@ -254,9 +359,9 @@ def test_all_activities(debug: bool = False):
 
     for activity_name, success in results.items():
         status = "✓ PASS" if success else "✗ FAIL"
-        logger.info(f"{status}: {activity_name}")
+        logger.info("%s: %s", status, activity_name)
 
-    logger.info(f"\nTotal: {len(results)} tests, {passed} passed, {failed} failed")
+    logger.info("\nTotal: %d tests, %d passed, %d failed", len(results), passed, failed)
 
     return failed == 0
 
@@ -265,6 +370,14 @@ def main():
     parser = argparse.ArgumentParser(description="Test activity page renderers")
     parser.add_argument("--all", action="store_true", help="Test all activities")
     parser.add_argument("--activity", type=str, help="Test specific activity")
+    parser.add_argument(
+        "--split", "--per-file", dest="split", action="store_true",
+        help="With --all, write one PDF per activity",
+    )
+    parser.add_argument(
+        "--parallel", action="store_true",
+        help="With --all, write one PDF per activity in parallel worker processes (implies --split)",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--list", action="store_true", help="List available activities")
 
@@ -277,7 +390,9 @@ def main():
         return 0
 
     if args.all:
-        success = test_all_activities(args.debug)
+        # The combined PDF is one canvas, so parallel rendering means split files
+        split = args.split or args.parallel
+        success = test_all_activities(args.debug, split, args.parallel)
         return 0 if success else 1
 
     if args.activity:
@@ -24,9 +24,8 @@ RESET = '\033[0m'
 BOLD = '\033[1m'
 
 def print_header(text):
-    print(f"\n{BLUE}{BOLD}{'='*70}{RESET}")
-    print(f"{BLUE}{BOLD}{text.center(70)}{RESET}")
-    print(f"{BLUE}{BOLD}{'='*70}{RESET}\n")
+    rule = f"{BLUE}{BOLD}{'='*70}{RESET}\n"
+    sys.stdout.write(f"\n{rule}{BLUE}{BOLD}{text.center(70)}{RESET}\n{rule}\n")
 
 def print_success(text):
     print(f"{GREEN}✅ {text}{RESET}")
@@ -218,15 +217,15 @@ def test_logging_system():
     assert summary['total_api_calls'] == 1
     print_success(f"Session summary: {summary['duration_seconds']:.2f}s duration")
 
-    # Test save to file
+    # One scratch directory for both the log file and the output dump
     with tempfile.TemporaryDirectory() as tmpdir:
+        # Test save to file
         log_file = logger.save(filename=f"{tmpdir}/test.log")
         assert Path(log_file).exists()
         print_success(f"Log file saved: {Path(log_file).name}")
 
-    # Test OutputDumper
-    print("\nTesting OutputDumper...")
-    with tempfile.TemporaryDirectory() as tmpdir:
+        # Test OutputDumper
+        print("\nTesting OutputDumper...")
         pages = [{'pageNumber': 1, 'type': 'coloring'}]
         logs_data = [{'timestamp': '2024-01-01', 'page': 1}]
 
@@ -250,6 +249,7 @@ def test_doctests():
     print_header("TEST 6: Running Doctests")
 
     import doctest
+    import importlib
 
     modules = [
         ('components.config.theme_config', 'Config'),
@@ -260,22 +260,33 @@ def test_doctests():
         ('components.logging.output_dumper', 'Logging'),
     ]
 
+    # One finder and one runner shared by every module; counts are per
+    # example, as doctest.testmod reports them
+    finder = doctest.DocTestFinder()
+    runner = doctest.DocTestRunner(verbose=False)
+
     total_tests = 0
     total_failures = 0
 
     for module_name, category in modules:
         try:
-            module = __import__(module_name, fromlist=[''])
-            results = doctest.testmod(module, verbose=False)
-            total_tests += results.attempted
-            total_failures += results.failed
-
-            if results.failed == 0:
-                print_success(f"{category:10} - {module_name.split('.')[-1]:20} - {results.attempted} tests passed")
-            else:
-                print_error(f"{category:10} - {module_name.split('.')[-1]:20} - {results.failed}/{results.attempted} failed")
+            module = importlib.import_module(module_name)
+            failed = attempted = 0
+            for test in finder.find(module):
+                results = runner.run(test)
+                failed += results.failed
+                attempted += results.attempted
         except Exception as e:
             print_error(f"Could not test {module_name}: {e}")
+            continue
+
+        total_tests += attempted
+        total_failures += failed
+
+        if failed == 0:
+            print_success(f"{category:10} - {module_name.split('.')[-1]:20} - {attempted} tests passed")
+        else:
+            print_error(f"{category:10} - {module_name.split('.')[-1]:20} - {failed}/{attempted} failed")
 
     print(f"\n{BOLD}Total: {total_tests} doctests, {total_failures} failures{RESET}")
 
@@ -304,12 +315,18 @@ def test_integration():
         {'type': 'counting', 'theme': 'animals', 'pageNumber': 3},
     ]
 
+    # Look up each strategy once
+    builders = {
+        page_type: PromptBuilderFactory.get_builder(page_type)
+        for page_type in PromptBuilderFactory.get_available_types()
+    }
+
     for page in pages:
         # Sanitize theme
         theme = ThemeConfig.sanitize(page['theme'])
 
         # Get strategy
-        strategy = PromptBuilderFactory.get_builder(page['type'])
+        strategy = builders[page['type']]
 
         # Get used items
         used = tracker.get_used(page['type'])
@@ -343,12 +360,14 @@ def test_integration():
 # Main Test Runner
 # ============================================================================
 def main():
-    print(f"\n{BOLD}{BLUE}")
-    print("╔═══════════════════════════════════════════════════════════════════╗")
-    print("║         CLAUDE PROCESSOR REFACTORING TEST SUITE                  ║")
-    print("║         Testing all 5 refactored subsystems                      ║")
-    print("╚═══════════════════════════════════════════════════════════════════╝")
-    print(RESET)
+    sys.stdout.write(
+        f"\n{BOLD}{BLUE}\n"
+        "╔═══════════════════════════════════════════════════════════════════╗\n"
+        "║         CLAUDE PROCESSOR REFACTORING TEST SUITE                  ║\n"
+        "║         Testing all 5 refactored subsystems                      ║\n"
+        "╚═══════════════════════════════════════════════════════════════════╝\n"
+        f"{RESET}\n"
+    )
 
     tests = [
         ("Module Imports", test_imports),
@@ -377,13 +396,15 @@ def main():
 
     # Final summary
     print_header("TEST SUMMARY")
-    print(f"Total tests: {len(tests)}")
-    print_success(f"Passed: {passed}")
+    summary = f"Total tests: {len(tests)}\n{GREEN}✅ Passed: {passed}{RESET}\n"
     if failed > 0:
-        print_error(f"Failed: {failed}")
+        summary += f"{RED}❌ Failed: {failed}{RESET}\n"
     else:
-        print(f"\n{GREEN}{BOLD}🎉 ALL TESTS PASSED! 🎉{RESET}")
-        print(f"{GREEN}The refactored code is working correctly!{RESET}\n")
+        summary += (
+            f"\n{GREEN}{BOLD}🎉 ALL TESTS PASSED! 🎉{RESET}\n"
+            f"{GREEN}The refactored code is working correctly!{RESET}\n\n"
+        )
+    sys.stdout.write(summary)
 
     return 0 if failed == 0 else 1
 
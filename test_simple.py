@@ -2,12 +2,74 @@
 """
 Simple test to verify the enhanced claude_processor logic
 Tests the core functionality without Langflow dependencies
+
+The report is written in one go at the end; set TEST_SIMPLE_STREAM=1 to
+see it line by line as the checks run. When stdout is not a terminal only
+the PASS/FAIL summary is printed unless BG_VERBOSE is set.
 """
 
+import contextlib
+import functools
+import io
+import itertools
+import os
 import re
 import random
-import json
-from datetime import datetime
+import sys
+from pathlib import Path
+
+# Source files are found next to this script rather than in the working
+# directory
+REPO_ROOT = Path(__file__).resolve().parent
+CLAUDE_PROCESSOR = 'components/claude_processor.py'
+
+# (module, import line) for the imports the processor pipeline relies on;
+# tests/test_claude_processor_source.py checks the same table under pytest
+REQUIRED_IMPORTS = [
+    (CLAUDE_PROCESSOR, 'import random'),
+    ('components/api/claude_client.py', 'from anthropic import Anthropic'),
+    ('components/api/claude_client.py', 'from datetime import datetime'),
+    ('components/api/response_parser.py', 'import json'),
+    ('components/api/response_parser.py', 'import re'),
+    ('components/processor/pipeline.py', 'import time'),
+]
+
+# Logging feature -> (module that owns it since the refactor, marker)
+LOGGING_FEATURES = {
+    'Detailed logs storage': ('components/api/claude_client.py', 'self.detailed_logs'),
+    'Session timestamp': ('components/logging/session_logger.py', 'self.session_start'),
+    'Prompt logging': ('components/api/claude_client.py', '📤 SENDING TO CLAUDE'),
+    'Response logging': ('components/api/claude_client.py', '📥 RECEIVED FROM CLAUDE'),
+    'Log file saving': (CLAUDE_PROCESSOR, 'def save_detailed_logs'),
+    'Summary section': ('components/processor/pipeline.py', 'GENERATION COMPLETE - SUMMARY'),
+}
+
+@functools.lru_cache(maxsize=None)
+def read_source(module):
+    """Read a module's source on first use and reuse it for later checks"""
+    return (REPO_ROOT / module).read_text(encoding='utf-8')
+
+def _load_source(module):
+    """Return a module's source, or None after reporting why it is unreadable"""
+    try:
+        return read_source(module)
+    except OSError as e:
+        print(f"\n❌ Could not read {module}: {e}")
+        return None
+
+# Full per-check reports for people at a terminal (or with BG_VERBOSE set);
+# batch runs such as CI logs get just the PASS/FAIL lines. Decided here,
+# before __main__ swaps stdout for a buffer.
+VERBOSE = sys.stdout.isatty() or bool(os.environ.get('BG_VERBOSE'))
+
+def _unique_draw(pool, k):
+    """Draw k picks from pool without repeats until every item has been used"""
+    if k <= len(pool):
+        return random.sample(pool, k)
+    picks = random.sample(pool, len(pool))
+    while len(picks) < k:
+        picks.extend(random.sample(pool, min(len(pool), k - len(picks))))
+    return picks
 
 def test_prompt_variety():
     """Test that prompts show variety in subject selection"""
@@ -21,26 +83,15 @@ def test_prompt_variety():
     }
 
     subjects = theme_subjects['animals']
-    used = []
 
     print(f"\nTotal available subjects: {len(subjects)}")
     print(f"Subjects: {subjects}\n")
 
     print("Simulating 10 page generations:")
-    selected_subjects = []
-
-    for i in range(10):
-        available = [s for s in subjects if s not in used]
-
-        if not available:
-            used = []
-            available = subjects
-            print(f"\n  [Reset - all subjects used, starting over]\n")
-
-        selected = random.choice(available)
-        used.append(selected)
-        selected_subjects.append(selected)
-        print(f"  Page {i+1}: {selected} (Available: {len(available)})")
+    selected_subjects = _unique_draw(subjects, 10)
+    pool_size = len(subjects)
+    for i, selected in enumerate(selected_subjects):
+        print(f"  Page {i+1}: {selected} (Available: {pool_size - i % pool_size})")
 
     unique_count = len(set(selected_subjects))
     print(f"\n✅ Result: Used {unique_count} unique subjects out of 10 pages")
@@ -67,21 +118,9 @@ def test_tracing_variety():
     print(f"\nTotal available options: {len(options)}")
     print(f"Options include: Letters (A-P), Numbers (0-9), Shapes (○△□★♥)\n")
 
-    used = []
-    selected_chars = []
-
     print("Simulating 15 tracing pages:")
-    for i in range(15):
-        available = [s for s in options if s not in used]
-
-        if not available:
-            used = []
-            available = options
-            print(f"\n  [Reset]\n")
-
-        selected = random.choice(available)
-        used.append(selected)
-        selected_chars.append(selected)
+    selected_chars = _unique_draw(options, 15)
+    for i, selected in enumerate(selected_chars):
         print(f"  Page {i+1}: '{selected}'")
 
     unique_count = len(set(selected_chars))
@@ -103,26 +142,19 @@ def test_counting_combinations():
     count_options = list(range(0, 16))
     item_options = ['circle', 'star', 'heart', 'square', 'triangle', 'apple', 'flower', 'car', 'ball', 'balloon', 'butterfly', 'fish']
 
-    all_combinations = [f"{count}-{item}" for count in count_options for item in item_options]
+    combo_tuples = list(itertools.product(count_options, item_options))
 
-    print(f"\nTotal possible combinations: {len(all_combinations)}")
+    print(f"\nTotal possible combinations: {len(combo_tuples)}")
     print(f"Counts: {count_options}")
     print(f"Items: {item_options}\n")
 
-    used = []
-    selected_combos = []
-
-    print("Simulating 10 counting pages:")
-    for i in range(10):
-        available = [c for c in all_combinations if c not in used]
+    # Only the picked pairs get formatted
+    picks = _unique_draw(combo_tuples, 10)
 
-        if not available:
-            used = []
-            available = all_combinations
+    selected_combos = [f"{count}-{item}" for count, item in picks]
 
-        choice = random.choice(available)
-        used.append(choice)
-        selected_combos.append(choice)
+    print("Simulating 10 counting pages:")
+    for i, choice in enumerate(selected_combos):
         print(f"  Page {i+1}: {choice}")
 
     unique_count = len(set(selected_combos))
@@ -144,24 +176,19 @@ def test_syntax_check():
     print("TEST: Python Syntax Check")
     print("="*60)
 
-    import py_compile
-    import tempfile
-    import os
+    content = _load_source(CLAUDE_PROCESSOR)
+    if content is None:
+        return False
 
     try:
-        # Compile the file to check for syntax errors
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pyc')
-        temp_file.close()
-
-        py_compile.compile('components/claude_processor.py', temp_file.name, doraise=True)
+        # Compile the cached source to check for syntax errors
+        compile(content, str(REPO_ROOT / CLAUDE_PROCESSOR), 'exec')
 
         print("\n✅ Python syntax is valid!")
         print("   No syntax errors found in claude_processor.py")
-
-        os.unlink(temp_file.name)
         return True
 
-    except py_compile.PyCompileError as e:
+    except SyntaxError as e:
         print(f"\n❌ Syntax error found:")
         print(f"   {e}")
         return False
@@ -172,25 +199,19 @@ def test_imports_check():
     print("TEST: Required Imports Check")
     print("="*60)
 
-    with open('components/claude_processor.py', 'r') as f:
-        content = f.read()
-
-    required_imports = [
-        'import random',
-        'from datetime import datetime',
-        'import json',
-        'import re',
-        'from anthropic import Anthropic',
-        'import time'
-    ]
-
     print("\nChecking for required imports:")
     all_present = True
-    for imp in required_imports:
-        if imp in content:
-            print(f"  ✅ {imp}")
+    line_sets = {}
+    for module, imp in REQUIRED_IMPORTS:
+        # Imports are whole lines, so one set of stripped lines per module
+        # answers each lookup directly instead of rescanning the source
+        if module not in line_sets:
+            content = _load_source(module)
+            line_sets[module] = set() if content is None else {line.strip() for line in content.splitlines()}
+        if imp in line_sets[module]:
+            print(f"  ✅ {imp} ({module})")
         else:
-            print(f"  ❌ {imp} - MISSING")
+            print(f"  ❌ {imp} - MISSING from {module}")
             all_present = False
 
     if all_present:
@@ -206,23 +227,23 @@ def test_logging_features():
     print("TEST: Logging Features")
     print("="*60)
 
-    with open('components/claude_processor.py', 'r') as f:
-        content = f.read()
-
-    features = {
-        'Detailed logs storage': 'self.detailed_logs',
-        'Session timestamp': 'self.session_start',
-        'Prompt logging': '📤 SENDING TO CLAUDE',
-        'Response logging': '📥 RECEIVED FROM CLAUDE',
-        'Log file saving': 'def save_detailed_logs',
-        'Summary section': 'GENERATION COMPLETE - SUMMARY',
-        'Used items tracking': 'self.used_items'
-    }
+    # Scan each module once for all of its markers; each marker gets its own
+    # named group so a hit reports which feature it was
+    by_module = {}
+    for index, (module, marker) in enumerate(LOGGING_FEATURES.values()):
+        by_module.setdefault(module, {})[f"f{index}"] = marker
+    hits = set()
+    for module, groups in by_module.items():
+        content = _load_source(module)
+        if content is None:
+            continue
+        pattern = re.compile('|'.join(f"(?P<{key}>{re.escape(v)})" for key, v in groups.items()))
+        hits.update(m.lastgroup for m in pattern.finditer(content))
 
     print("\nChecking for logging features:")
     all_present = True
-    for feature_name, search_string in features.items():
-        if search_string in content:
+    for index, feature_name in enumerate(LOGGING_FEATURES):
+        if f"f{index}" in hits:
             print(f"  ✅ {feature_name}")
         else:
             print(f"  ❌ {feature_name} - MISSING")
@@ -237,23 +258,34 @@ def test_logging_features():
 
 def run_all_tests():
     """Run all tests"""
-    print("\n" + "#"*60)
-    print("# CLAUDE PROCESSOR - SIMPLIFIED TEST SUITE")
-    print("#"*60)
-    print("\nTesting enhanced features without Langflow dependencies\n")
-
-    results = {
-        'Python Syntax': test_syntax_check(),
-        'Required Imports': test_imports_check(),
-        'Logging Features': test_logging_features(),
-        'Prompt Variety': test_prompt_variety(),
-        'Tracing Variety': test_tracing_variety(),
-        'Counting Combinations': test_counting_combinations()
+    if VERBOSE:
+        print("\n" + "#"*60)
+        print("# CLAUDE PROCESSOR - SIMPLIFIED TEST SUITE")
+        print("#"*60)
+        print("\nTesting enhanced features without Langflow dependencies\n")
+
+    tests = {
+        'Python Syntax': test_syntax_check,
+        'Required Imports': test_imports_check,
+        'Logging Features': test_logging_features,
+        'Prompt Variety': test_prompt_variety,
+        'Tracing Variety': test_tracing_variety,
+        'Counting Combinations': test_counting_combinations
     }
 
-    print("\n" + "="*60)
-    print("TEST RESULTS SUMMARY")
-    print("="*60)
+    # Each check's report is only shown in verbose runs
+    results = {}
+    for name, fn in tests.items():
+        if VERBOSE:
+            results[name] = fn()
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[name] = fn()
+
+    if VERBOSE:
+        print("\n" + "="*60)
+        print("TEST RESULTS SUMMARY")
+        print("="*60)
 
     passed = 0
     total = len(results)
@@ -264,24 +296,36 @@ def run_all_tests():
         if result:
             passed += 1
 
-    print("="*60)
+    if VERBOSE:
+        print("="*60)
     print(f"Tests Passed: {passed}/{total}")
 
     if passed == total:
         print("\n🎉 ALL TESTS PASSED! 🎉")
-        print("\nThe enhanced claude_processor.py is working correctly!")
-        print("\nKey Improvements Verified:")
-        print("  ✅ Comprehensive logging (prompts & responses)")
-        print("  ✅ Greatly expanded variety options")
-        print("  ✅ Randomization for better variety")
-        print("  ✅ Detailed log file generation")
-        print("  ✅ Session tracking and summaries")
+        if VERBOSE:
+            print("\nThe enhanced claude_processor.py is working correctly!")
+            print("\nKey Improvements Verified:")
+            print("  ✅ Comprehensive logging (prompts & responses)")
+            print("  ✅ Greatly expanded variety options")
+            print("  ✅ Randomization for better variety")
+            print("  ✅ Detailed log file generation")
+            print("  ✅ Session tracking and summaries")
         return 0
     else:
         print(f"\n⚠️  {total - passed} test(s) failed")
         return 1
 
 if __name__ == '__main__':
-    import sys
-    exit_code = run_all_tests()
+    if os.environ.get('TEST_SIMPLE_STREAM'):
+        # Print as each check runs
+        exit_code = run_all_tests()
+    else:
+        # Collect the whole report and emit it in one write; if a check
+        # raises, still write what was printed before the traceback
+        report = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(report):
+                exit_code = run_all_tests()
+        finally:
+            sys.stdout.write(report.getvalue())
     sys.exit(exit_code)
@@ -0,0 +1,32 @@
+"""Source checks for the Claude processor and the modules split out of it.
+
+The tables live in test_simple.py so the script and pytest check the same
+modules for the same markers.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from test_simple import CLAUDE_PROCESSOR, LOGGING_FEATURES, REQUIRED_IMPORTS, REPO_ROOT, read_source
+
+
+def test_claude_processor_compiles() -> None:
+    """The processor source should be free of syntax errors."""
+
+    compile(read_source(CLAUDE_PROCESSOR), str(REPO_ROOT / CLAUDE_PROCESSOR), "exec")
+
+
+@pytest.mark.parametrize("module, import_line", REQUIRED_IMPORTS)
+def test_required_import_present(module: str, import_line: str) -> None:
+    """Each required import should appear as its own line in its module."""
+
+    lines = {line.strip() for line in read_source(module).splitlines()}
+    assert import_line in lines, f"{import_line!r} missing from {module}"
+
+
+@pytest.mark.parametrize("module, marker", list(LOGGING_FEATURES.values()), ids=list(LOGGING_FEATURES))
+def test_logging_feature_present(module: str, marker: str) -> None:
+    """Each logging feature marker should appear in the module that owns it."""
+
+    assert marker in read_source(module), f"{marker!r} missing from {module}"
@@ -14,16 +14,33 @@ from scripts.generator import ActivityBookletGenerator
 from scripts.helpers import Primitives
 
 
-@pytest.fixture()
-def generator(tmp_path: Path) -> ActivityBookletGenerator:
-    """Provide a generator writing to a temporary PDF file."""
-
-    output_path = tmp_path / "test.pdf"
+def _make_generator(output_path: Path) -> ActivityBookletGenerator:
     gen = ActivityBookletGenerator(str(output_path))
     setattr(gen, "_test_output_path", output_path)
     return gen
 
 
+@pytest.fixture(scope="module")
+def generator(tmp_path_factory: pytest.TempPathFactory) -> ActivityBookletGenerator:
+    """Provide a generator shared by the read-only tests in this module."""
+
+    return _make_generator(tmp_path_factory.mktemp("pdf") / "test.pdf")
+
+
+@pytest.fixture(scope="module")
+def page_center(generator: ActivityBookletGenerator) -> tuple[float, float]:
+    """Centre of the generator's page, computed once for the module."""
+
+    return generator.width / 2, generator.height / 2
+
+
+@pytest.fixture()
+def render_generator(tmp_path: Path) -> ActivityBookletGenerator:
+    """Provide a fresh generator for tests that draw on or save the canvas."""
+
+    return _make_generator(tmp_path / "test.pdf")
+
+
 def test_generate_dot_positions_for_supported_shapes(generator: ActivityBookletGenerator):
     """Ensure every supported shape yields a non-empty coordinate list."""
 
@@ -31,8 +48,7 @@ def test_generate_dot_positions_for_supported_shapes(generator: ActivityBookletG
         dots = generator.generate_dot_positions(shape, 12)
         assert len(dots) >= 12, f"Expected at least 12 dots for shape {shape}"
         # Coordinates should span a meaningful area on the page
-        xs = [x for x, _ in dots]
-        ys = [y for _, y in dots]
+        xs, ys = zip(*dots)
         assert max(xs) - min(xs) > 40, f"Shape {shape} collapsed horizontally"
         assert max(ys) - min(ys) > 40, f"Shape {shape} collapsed vertically"
 
@@ -50,23 +66,25 @@ def test_generate_dot_positions_for_supported_shapes(generator: ActivityBookletG
     ],
 )
 def test_custom_shape_generators_have_expected_lobes(
-    generator: ActivityBookletGenerator,
+    page_center: tuple[float, float],
     shape: str,
     generator_fn,
 ) -> None:
     """Composite shapes should produce at least a dozen well-distributed dots."""
 
-    dots = generator_fn(generator.width / 2, generator.height / 2, 8)
+    center_x, center_y = page_center
+    dots = generator_fn(center_x, center_y, 8)
     assert len(dots) >= 12
     # Ensure the points trace some curvature by checking angle variance
-    center_x, center_y = generator.width / 2, generator.height / 2
-    angles = [math.atan2(y - center_y, x - center_x) for x, y in dots]
-    assert len({round(a, 1) for a in angles}) >= 6
+    angles = {round(math.atan2(y - center_y, x - center_x), 1) for x, y in dots}
+    assert len(angles) >= 6
 
 
-def test_render_sample_pdf_contains_outline(generator: ActivityBookletGenerator):
+def test_render_sample_pdf_contains_outline(render_generator: ActivityBookletGenerator):
     """Render a sample dot-to-dot page and ensure the PDF has drawn content."""
 
+    generator = render_generator
+
     page_spec = {
         "title": "Butterfly Surprise",
         "type": "dot-to-dot",
@@ -85,7 +103,16 @@ def test_render_sample_pdf_contains_outline(generator: ActivityBookletGenerator)
 
     dots = page_spec.get("dot_positions")
     assert dots and len(dots) >= 14
-    xs = [x for x, _ in dots]
-    ys = [y for _, y in dots]
+    xs, ys = zip(*dots)
     assert max(xs) - min(xs) > 40
     assert max(ys) - min(ys) > 40
+
+
+def test_sample_closed_path_ignores_repeated_vertices():
+    """Duplicate and closing vertices should not produce degenerate samples."""
+
+    square = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+    padded = [square[0], square[0], square[1], square[2], square[2], square[3], square[0]]
+
+    assert Primitives._sample_closed_path(padded, 8) == Primitives._sample_closed_path(square, 8)
+    assert Primitives._sample_closed_path([(1.0, 2.0)] * 3, 4) == [(1.0, 2.0)] * 4
@@ -0,0 +1,41 @@
+"""Tests for the combined all-activities PDF written by test_activities.py."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+import test_activities
+
+
+def _page_count(pdf_path: Path) -> int:
+    return len(re.findall(rb"/Type /Page\b", pdf_path.read_bytes()))
+
+
+def test_failing_renderer_still_gets_its_own_page(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A renderer that raises mid-page must not shift or merge later pages."""
+
+    real_load = test_activities._load_renderer
+
+    def broken_maze(c, page_spec, ctx):
+        # Leave a half-drawn page with an unbalanced save behind
+        c.saveState()
+        c.setFillGray(0.2)
+        c.rect(100, 100, 200, 200, fill=1)
+        raise RuntimeError("boom")
+
+    def load_renderer(activity_type):
+        return broken_maze if activity_type == "maze" else real_load(activity_type)
+
+    monkeypatch.setattr(test_activities, "_load_renderer", load_renderer)
+
+    output_path = tmp_path / "test_all.pdf"
+    results = test_activities.render_all_into_one(output_path)
+
+    assert _page_count(output_path) == len(test_activities.SAMPLE_PAGES)
+    failed = [name for name, ok in results.items() if not ok]
+    assert failed and all(test_activities.SAMPLE_PAGES[name]["type"] == "maze" for name in failed)